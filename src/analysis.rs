@@ -3,6 +3,7 @@ use petgraph::{
     visit::EdgeRef,
 };
 use std::collections::{HashMap, HashSet, VecDeque};
+use std::sync::atomic::{AtomicUsize, Ordering};
 
 #[derive(Debug)]
 pub struct GraphAnalysis {
@@ -23,84 +24,116 @@ pub struct GraphAnalysis {
 }
 
 impl GraphAnalysis {
-    /// Calculate betweenness centrality for a single source node
+    /// Calculate betweenness centrality for a single source node.
+    ///
+    /// All per-node state lives in plain Vecs indexed by `NodeIndex::index()`;
+    /// the indices of a petgraph Graph are dense, so hashing them per access
+    /// would be pure overhead in this inner loop.
     fn calculate_betweenness_from_source(
         graph: &Graph<(), ()>,
         source: NodeIndex,
-        centrality: &mut HashMap<NodeIndex, f64>,
+        centrality: &mut [f64],
     ) {
+        let n = graph.node_count();
         let mut stack = Vec::new();
         let mut queue = VecDeque::new();
-        let mut sigma = HashMap::new();
-        let mut distance = HashMap::new();
-        let mut pred: HashMap<NodeIndex, Vec<NodeIndex>> = HashMap::new();
-        let mut delta = HashMap::new();
+        let mut sigma = vec![0.0; n];
+        let mut distance = vec![-1i32; n];
+        let mut pred: Vec<Vec<NodeIndex>> = vec![Vec::new(); n];
+        let mut delta = vec![0.0; n];
 
-        // Initialize
-        for node in graph.node_indices() {
-            sigma.insert(node, 0.0);
-            distance.insert(node, -1);
-            pred.insert(node, Vec::new());
-            delta.insert(node, 0.0);
-        }
-
-        sigma.insert(source, 1.0);
-        distance.insert(source, 0);
+        sigma[source.index()] = 1.0;
+        distance[source.index()] = 0;
         queue.push_back(source);
 
         // BFS phase - find shortest paths
         while let Some(v) = queue.pop_front() {
             stack.push(v);
-            let v_dist = distance[&v];
-            let v_sigma = sigma[&v];
+            let v_dist = distance[v.index()];
+            let v_sigma = sigma[v.index()];
 
             for neighbor in graph.neighbors(v) {
                 // First time we found this node?
-                if distance[&neighbor] < 0 {
+                if distance[neighbor.index()] < 0 {
                     queue.push_back(neighbor);
-                    distance.insert(neighbor, v_dist + 1);
+                    distance[neighbor.index()] = v_dist + 1;
                 }
 
                 // Shortest path to neighbor via v?
-                if distance[&neighbor] == v_dist + 1 {
-                    *sigma.get_mut(&neighbor).unwrap() += v_sigma;
-                    pred.get_mut(&neighbor).unwrap().push(v);
+                if distance[neighbor.index()] == v_dist + 1 {
+                    sigma[neighbor.index()] += v_sigma;
+                    pred[neighbor.index()].push(v);
                 }
             }
         }
 
         // Dependency accumulation phase - calculate contributions
         while let Some(w) = stack.pop() {
-            for &v in &pred[&w] {
-                let contribution = (sigma[&v] / sigma[&w]) * (1.0 + delta[&w]);
-                *delta.get_mut(&v).unwrap() += contribution;
+            for &v in &pred[w.index()] {
+                let contribution = (sigma[v.index()] / sigma[w.index()]) * (1.0 + delta[w.index()]);
+                delta[v.index()] += contribution;
             }
 
             if w != source {
-                *centrality.get_mut(&w).unwrap() += delta[&w];
+                centrality[w.index()] += delta[w.index()];
             }
         }
     }
 
     /// Calculate betweenness centrality for all nodes
     fn calculate_betweenness_centrality(graph: &Graph<(), ()>) -> HashMap<NodeIndex, f64> {
-        let mut centrality: HashMap<NodeIndex, f64> =
-            graph.node_indices().map(|n| (n, 0.0)).collect();
-
-        // Calculate betweenness from each source node
-        for source in graph.node_indices() {
-            Self::calculate_betweenness_from_source(graph, source, &mut centrality);
-        }
+        // Each source node contributes independently, so fan the sources out
+        // over the available cores and sum the per-thread partial scores
+        let sources: Vec<NodeIndex> = graph.node_indices().collect();
+        let worker_count = std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1)
+            .min(sources.len().max(1));
+        let next = AtomicUsize::new(0);
+
+        let mut scores = vec![0.0; graph.node_count()];
+
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = (0..worker_count)
+                .map(|_| {
+                    scope.spawn(|| {
+                        let mut partial = vec![0.0; graph.node_count()];
+                        loop {
+                            let i = next.fetch_add(1, Ordering::Relaxed);
+                            let Some(&source) = sources.get(i) else {
+                                break;
+                            };
+                            Self::calculate_betweenness_from_source(graph, source, &mut partial);
+                        }
+                        partial
+                    })
+                })
+                .collect();
+
+            for handle in handles {
+                for (i, score) in handle
+                    .join()
+                    .expect("betweenness worker panicked")
+                    .into_iter()
+                    .enumerate()
+                {
+                    scores[i] += score;
+                }
+            }
+        });
 
         // Normalize for undirected graphs
         if graph.node_count() > 2 {
             let norm = 1.0 / ((graph.node_count() - 1) * (graph.node_count() - 2)) as f64;
-            for score in centrality.values_mut() {
+            for score in &mut scores {
                 *score *= norm;
             }
         }
 
-        centrality
+        graph
+            .node_indices()
+            .map(|node| (node, scores[node.index()]))
+            .collect()
     }
 
     /// Analyze the graph to find both SCCs and betweenness centrality
@@ -131,18 +164,17 @@ impl GraphAnalysis {
             }
         }
 
-        // Step 2: Create transposed graph
+        // Step 2: Create transposed graph. Nodes are added in index order, so
+        // every node keeps its index in the transposed graph and no mapping
+        // table (or reverse lookup) is needed
         let mut transposed = Graph::new();
-        let mut node_map = HashMap::new();
-
-        // Add all nodes
-        for node in graph.node_indices() {
-            node_map.insert(node, transposed.add_node(()));
+        for _ in graph.node_indices() {
+            transposed.add_node(());
         }
 
         // Add reversed edges
         for edge in graph.edge_references() {
-            transposed.add_edge(node_map[&edge.target()], node_map[&edge.source()], ());
+            transposed.add_edge(edge.target(), edge.source(), ());
         }
 
         // Step 3: Second DFS to find SCCs
@@ -150,22 +182,13 @@ impl GraphAnalysis {
         let mut current_scc = HashSet::new();
 
         for &node in finish_order.iter().rev() {
-            let transposed_node = node_map[&node];
-            if !visited.contains(&transposed_node) {
+            if !visited.contains(&node) {
                 current_scc.clear();
-                Self::dfs_second_pass(&transposed, transposed_node, &mut visited, &mut current_scc);
-
-                // Map back to original nodes
-                let original_scc: HashSet<_> = current_scc
-                    .iter()
-                    .map(|&n| {
-                        node_map
-                            .iter()
-                            .find(|&(_, &v)| v == n)
-                            .map(|(&k, _)| k)
-                            .unwrap()
-                    })
-                    .collect();
+                Self::dfs_second_pass(&transposed, node, &mut visited, &mut current_scc);
+
+                // Indices coincide with the original graph, so the component
+                // maps back as-is
+                let original_scc: HashSet<_> = current_scc.clone();
 
                 // Update largest SCC if this one is bigger
                 if original_scc.len() > analysis.largest_scc_size {
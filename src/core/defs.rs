@@ -1,6 +1,6 @@
 use once_cell::sync::Lazy;
 use std::collections::{HashMap, HashSet};
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 use tiny_skia::Color;
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
@@ -23,8 +23,8 @@ impl Language {
         }
     }
 
-    /// Try to detect the language from a file extension or config file name
-    pub fn from_file(filename: &str) -> Option<Self> {
+    /// Try to detect the language from a file's extension
+    pub fn from_path(path: &Path) -> Option<Self> {
         static EXTENSION_MAP: Lazy<HashMap<&'static str, Language>> = Lazy::new(|| {
             let mut map = HashMap::new();
             for lang in &[
@@ -40,7 +40,9 @@ impl Language {
             map
         });
 
-        let ext = filename.split('.').next_back().unwrap_or(filename);
+        // Path::extension avoids scanning the whole path string for dots
+        // (directories with dots in their names used to confuse detection)
+        let ext = path.extension()?.to_str()?;
         EXTENSION_MAP.get(ext).copied()
     }
 
@@ -69,15 +71,13 @@ impl Language {
     /// Returns the color associated with this language (in RGBA format)
     #[inline(always)]
     pub fn color_rgba(&self) -> Color {
+        // from_rgba8 is infallible, unlike the float constructor which
+        // validates ranges and returns an Option
         match self {
-            Language::Python => Color::from_rgba(1.0, 212.0 / 255.0, 59.0 / 255.0, 1.0).unwrap(),
-            Language::Rust => {
-                Color::from_rgba(222.0 / 255.0, 165.0 / 255.0, 132.0 / 255.0, 1.0).unwrap()
-            }
-            Language::TypeScript => {
-                Color::from_rgba(0.0, 122.0 / 255.0, 204.0 / 255.0, 1.0).unwrap()
-            }
-            Language::Cpp => Color::from_rgba(0.0, 89.0 / 255.0, 156.0 / 255.0, 1.0).unwrap(),
+            Language::Python => Color::from_rgba8(255, 212, 59, 255),
+            Language::Rust => Color::from_rgba8(222, 165, 132, 255),
+            Language::TypeScript => Color::from_rgba8(0, 122, 204, 255),
+            Language::Cpp => Color::from_rgba8(0, 89, 156, 255),
         }
     }
 }
@@ -154,8 +154,10 @@ impl FileNode {
     }
 
     #[inline(always)]
-    pub fn language(&self) -> &Language {
-        &self.language
+    pub fn language(&self) -> Language {
+        // Language is a fieldless Copy enum; returning it by value avoids a
+        // pointer indirection at every call site
+        self.language
     }
 
     #[inline(always)]
@@ -27,76 +27,92 @@ pub trait LanguageResolver {
     ) -> Vec<PathBuf>;
 }
 
-/// Multi-language graph builder
+/// Construct the resolver for a language
+fn resolver_for(language: Language) -> Box<dyn LanguageResolver> {
+    match language {
+        Language::Python => Box::new(PythonResolver::new()),
+        Language::Rust => Box::new(RustResolver::new()),
+        Language::TypeScript => Box::new(TypeScriptResolver::new()),
+        Language::Cpp => Box::new(CppResolver::new()),
+    }
+}
+
+/// Multi-language graph builder.
+///
+/// Resolvers are constructed on demand for the languages actually present
+/// in the node map, so a single-language project never pays for the other
+/// three.
 pub struct GraphBuilder {
     resolvers: HashMap<Language, Box<dyn LanguageResolver>>,
 }
 
 impl GraphBuilder {
     pub fn new() -> Self {
-        let mut resolvers: HashMap<Language, Box<dyn LanguageResolver>> = HashMap::new();
-        resolvers.insert(Language::Python, Box::new(PythonResolver::new()));
-        resolvers.insert(Language::Rust, Box::new(RustResolver::new()));
-        resolvers.insert(Language::TypeScript, Box::new(TypeScriptResolver::new()));
-        resolvers.insert(Language::Cpp, Box::new(CppResolver::new()));
-        Self { resolvers }
+        Self {
+            resolvers: HashMap::new(),
+        }
     }
 
-    /// Build graph edges for all languages
+    /// Build graph edges for all languages.
+    ///
+    /// Takes ownership of the node map so each FileNode can be moved into its
+    /// GraphNode instead of deep-cloning every import/function/reference set.
     pub fn build_graph_edges(
         &mut self,
-        node_map: &HashMap<PathBuf, FileNode>,
+        node_map: HashMap<PathBuf, FileNode>,
         project_root: &Path,
     ) -> Vec<GraphNode> {
         // Group files by language
         let mut files_by_language: HashMap<Language, Vec<PathBuf>> = HashMap::new();
-        for (file_path, node) in node_map {
+        for (file_path, node) in &node_map {
             files_by_language
-                .entry(*node.language())
+                .entry(node.language())
                 .or_default()
                 .push(file_path.clone());
         }
 
-        // Build module maps for each language
+        // Build module maps for each detected language, creating its
+        // resolver on first sight
         for (language, files) in &files_by_language {
-            if let Some(resolver) = self.resolvers.get_mut(language) {
-                resolver.build_module_map(files, project_root);
-            }
+            self.resolvers
+                .entry(*language)
+                .or_insert_with(|| resolver_for(*language))
+                .build_module_map(files, project_root);
         }
 
         // Build edges for each node
-        let mut graph_nodes = Vec::new();
+        let mut graph_nodes = Vec::with_capacity(node_map.len());
         for (file_path, node) in node_map {
             let mut edges = Vec::new();
             let mut resolved_imports = HashSet::new();
 
             // Use language-specific resolver
-            if let Some(resolver) = self.resolvers.get(node.language()) {
+            if let Some(resolver) = self.resolvers.get(&node.language()) {
                 for import in node.imports() {
                     if !import.is_local() {
                         continue; // Skip non-local imports for now
                     }
-                    if let Some(target_file) = resolver.resolve_import(import.path(), file_path)
-                        && target_file != *file_path
-                        && !resolved_imports.contains(&target_file)
+                    // insert() returning true doubles as the dedup check,
+                    // hashing the path once instead of twice
+                    if let Some(target_file) = resolver.resolve_import(import.path(), &file_path)
+                        && target_file != file_path
+                        && resolved_imports.insert(target_file.clone())
                     {
-                        edges.push(target_file.clone());
-                        resolved_imports.insert(target_file);
+                        edges.push(target_file);
                     }
                 }
 
                 // Process external references
                 let ext_refs =
-                    resolver.resolve_external_references(node.external_references(), file_path);
+                    resolver.resolve_external_references(node.external_references(), &file_path);
                 for target_file in ext_refs {
-                    if target_file != *file_path && !resolved_imports.contains(&target_file) {
-                        edges.push(target_file.clone());
-                        resolved_imports.insert(target_file);
+                    if target_file != file_path && resolved_imports.insert(target_file.clone()) {
+                        edges.push(target_file);
                     }
                 }
             }
 
-            graph_nodes.push(GraphNode::new(node.clone(), edges));
+            graph_nodes.push(GraphNode::new(node, edges));
         }
 
         graph_nodes
@@ -1,7 +1,121 @@
 use super::LanguageResolver;
+use once_cell::sync::Lazy;
+use std::cell::RefCell;
 use std::collections::{HashMap, HashSet};
 use std::path::{Path, PathBuf};
 
+/// Standard library headers to exclude. Shared across resolver instances;
+/// the contents never change, so there is no point building a set of owned
+/// strings per resolver
+static STDLIB_HEADERS: Lazy<HashSet<&'static str>> = Lazy::new(|| {
+    [
+        "iostream",
+        "fstream",
+        "sstream",
+        "iomanip",
+        "vector",
+        "list",
+        "deque",
+        "queue",
+        "stack",
+        "map",
+        "set",
+        "unordered_map",
+        "unordered_set",
+        "algorithm",
+        "numeric",
+        "functional",
+        "iterator",
+        "string",
+        "cstring",
+        "cctype",
+        "cmath",
+        "memory",
+        "utility",
+        "stdexcept",
+        "initializer_list",
+        "cassert",
+        "cerrno",
+        "cfloat",
+        "climits",
+        "cstddef",
+        "cstdint",
+        "cstdio",
+        "cstdlib",
+        "ctime",
+        "cwchar",
+        "thread",
+        "mutex",
+        "condition_variable",
+        "atomic",
+        "future",
+        "chrono",
+        "ratio",
+        "regex",
+        "random",
+        "complex",
+        "valarray",
+        "bitset",
+        "ostream",
+        "istream",
+        "streambuf",
+        "ios",
+    ]
+    .into_iter()
+    .collect()
+});
+
+/// External library prefixes to exclude
+static EXTERNAL_LIB_PREFIXES: Lazy<HashSet<&'static str>> = Lazy::new(|| {
+    [
+        // Boost library
+        "boost",
+        // Qt framework
+        "qt",
+        "QT",
+        "Qt",
+        // OpenGL and graphics
+        "gl",
+        "GL",
+        "glm",
+        "GLM",
+        "glfw",
+        "GLFW",
+        "sdl",
+        "SDL",
+        // CUDA and GPU
+        "cuda",
+        "CUDA",
+        "cudart",
+        // System headers
+        "sys",
+        "windows",
+        "windows.h",
+        "unistd",
+        "pthread",
+        "pthread.h",
+        "dirent",
+        "fcntl",
+        // Networking
+        "sys/socket",
+        "netinet/in",
+        "arpa/inet",
+        // Third-party libraries
+        "libxml",
+        "libcurl",
+        "curl",
+        "openssl",
+        "zlib",
+        "bzip2",
+        // Compiler specific
+        "intrin",
+        "immintrin",
+        "__builtin",
+    ]
+    .into_iter()
+    .collect()
+});
+
 /// C++ include resolver with caching
 #[derive(Default)]
 pub struct CppResolver {
@@ -9,130 +123,21 @@ pub struct CppResolver {
     include_to_file: HashMap<String, PathBuf>,
     /// Project root directory
     project_root: PathBuf,
-    /// Standard library headers to exclude
-    stdlib_headers: HashSet<String>,
-    /// External library prefixes to exclude
-    external_lib_prefixes: HashSet<String>,
+    /// Project root plus conventional include directories, precomputed when
+    /// the module map is built instead of re-joined on every lookup
+    base_search_dirs: Vec<PathBuf>,
+    /// Memoized outcomes of the on-disk fallback search, keyed by the
+    /// including file's directory and the include string. Every file in a
+    /// directory resolves the same include identically, and misses are
+    /// cached too, so an unresolvable include probes the filesystem once
+    /// instead of once per includer. RefCell because resolve_import takes
+    /// &self
+    resolution_cache: RefCell<HashMap<(PathBuf, String), Option<PathBuf>>>,
 }
 
 impl CppResolver {
     pub fn new() -> Self {
-        let mut resolver = Self::default();
-        resolver.init_stdlib_headers();
-        resolver.init_external_lib_prefixes();
-        resolver
-    }
-
-    fn init_stdlib_headers(&mut self) {
-        let headers = vec![
-            "iostream",
-            "fstream",
-            "sstream",
-            "iomanip",
-            "vector",
-            "list",
-            "deque",
-            "queue",
-            "stack",
-            "map",
-            "set",
-            "unordered_map",
-            "unordered_set",
-            "algorithm",
-            "numeric",
-            "functional",
-            "iterator",
-            "string",
-            "cstring",
-            "cctype",
-            "cmath",
-            "memory",
-            "utility",
-            "stdexcept",
-            "initializer_list",
-            "cassert",
-            "cerrno",
-            "cfloat",
-            "climits",
-            "cstddef",
-            "cstdint",
-            "cstdio",
-            "cstdlib",
-            "ctime",
-            "cwchar",
-            "thread",
-            "mutex",
-            "condition_variable",
-            "atomic",
-            "future",
-            "chrono",
-            "ratio",
-            "regex",
-            "random",
-            "complex",
-            "valarray",
-            "bitset",
-            "ostream",
-            "istream",
-            "streambuf",
-            "ios",
-        ];
-
-        for header in headers {
-            self.stdlib_headers.insert(header.to_string());
-        }
-    }
-
-    fn init_external_lib_prefixes(&mut self) {
-        let prefixes = vec![
-            // Boost library
-            "boost",
-            // Qt framework
-            "qt",
-            "QT",
-            "Qt",
-            // OpenGL and graphics
-            "gl",
-            "GL",
-            "glm",
-            "GLM",
-            "glfw",
-            "GLFW",
-            "sdl",
-            "SDL",
-            // CUDA and GPU
-            "cuda",
-            "CUDA",
-            "cudart",
-            // System headers
-            "sys",
-            "windows",
-            "windows.h",
-            "unistd",
-            "pthread",
-            "pthread.h",
-            "dirent",
-            "fcntl",
-            // Networking
-            "sys/socket",
-            "netinet/in",
-            "arpa/inet",
-            // Third-party libraries
-            "libxml",
-            "libcurl",
-            "curl",
-            "openssl",
-            "zlib",
-            "bzip2",
-            // Compiler specific
-            "intrin",
-            "immintrin",
-            "__builtin",
-        ];
-
-        for prefix in prefixes {
-            self.external_lib_prefixes.insert(prefix.to_string());
-        }
+        Self::default()
     }
 
     /// Check if a header is a standard library header
@@ -141,7 +146,7 @@ impl CppResolver {
             .trim_end_matches(".h")
             .trim_end_matches(".hpp")
             .trim_end_matches(".hxx");
-        self.stdlib_headers.contains(normalized)
+        STDLIB_HEADERS.contains(normalized)
     }
 
     /// Check if an include is from an external library (system or third-party)
@@ -149,7 +154,7 @@ impl CppResolver {
         let lower = header_name.to_lowercase();
 
         // Check for known external library prefixes
-        for prefix in &self.external_lib_prefixes {
+        for prefix in EXTERNAL_LIB_PREFIXES.iter() {
             let prefix_lower = prefix.to_lowercase();
             if lower.starts_with(&prefix_lower) {
                 // Check if it's actually a prefix match (followed by / or _)
@@ -187,44 +192,49 @@ impl CppResolver {
         // First, normalize separators to forward slashes
         let path = path.replace('\\', "/");
 
-        // Split into components and process them
-        let components: Vec<&str> = path.split('/').collect();
-        let mut normalized: Vec<String> = Vec::new();
+        // Write components straight into one output buffer; the recorded
+        // segment start offsets act as the component stack, so ".." can pop
+        // by truncating instead of rebuilding a Vec of owned strings
+        let mut result = String::with_capacity(path.len());
+        if path.starts_with('/') {
+            // Leading slash, preserve it
+            result.push('/');
+        }
+        let root_len = result.len();
+        let mut seg_starts: Vec<usize> = Vec::new();
 
-        for component in components {
+        for component in path.split('/') {
             match component {
-                "" | "." => {
-                    // Empty component or current directory - skip unless it's the first component
-                    if normalized.is_empty() && component.is_empty() {
-                        // Leading slash, preserve it
-                        continue;
-                    }
-                }
+                // Empty component or current directory - skip
+                "" | "." => {}
                 ".." => {
-                    // Parent directory - pop if possible
-                    if !normalized.is_empty() && normalized.last().is_some_and(|c| c != "..") {
-                        normalized.pop();
-                    } else if normalized.is_empty() {
-                        // Preserve .. at the start for relative paths
-                        normalized.push("..".to_string());
-                    } else {
-                        // Keep consecutive ..
-                        normalized.push("..".to_string());
+                    // Parent directory - pop the previous component if there
+                    // is one and it isn't itself a ".."
+                    match seg_starts.last() {
+                        Some(&start) if !result[start..].starts_with("..") => {
+                            seg_starts.pop();
+                            result.truncate(if start > root_len { start - 1 } else { start });
+                        }
+                        _ => {
+                            // Preserve leading/consecutive .. for relative paths
+                            if result.len() > root_len {
+                                result.push('/');
+                            }
+                            seg_starts.push(result.len());
+                            result.push_str("..");
+                        }
                     }
                 }
                 _ => {
-                    normalized.push(component.to_string());
+                    if result.len() > root_len {
+                        result.push('/');
+                    }
+                    seg_starts.push(result.len());
+                    result.push_str(component);
                 }
             }
         }
 
-        // Join back together, preserving leading slash if present
-        let result = if path.starts_with('/') {
-            format!("/{}", normalized.join("/"))
-        } else {
-            normalized.join("/")
-        };
-
         // Handle the case where result is empty
         if result.is_empty() {
             ".".to_string()
@@ -233,79 +243,53 @@ impl CppResolver {
         }
     }
 
-    /// Try to find a file in common include directories
-    fn find_include_file(&self, include_path: &str, from_file: &Path) -> Option<PathBuf> {
-        let normalized = self.normalize_path(include_path);
-
-        // Build search directories, ordered by priority
-        let mut search_dirs = Vec::new();
+    /// Probe one directory for the include, trying extension inference for
+    /// extensionless headers
+    fn probe_dir(search_dir: &Path, normalized: &str) -> Option<PathBuf> {
+        let candidate = search_dir.join(normalized);
+        if candidate.exists() && candidate.is_file() {
+            return Some(candidate);
+        }
 
-        // 1. Same directory as the including file (highest priority for local includes)
-        if let Some(parent) = from_file.parent() {
-            search_dirs.push(parent.to_path_buf());
+        // Also check with different extensions for header files without extension
+        if !normalized.contains('.') {
+            const EXTENSIONS: &[&str] =
+                &[".h", ".hpp", ".hxx", ".h++", ".cc", ".cpp", ".cxx", ".c++"];
+            for ext in EXTENSIONS {
+                let with_ext = search_dir.join(format!("{normalized}{ext}"));
+                if with_ext.exists() && with_ext.is_file() {
+                    return Some(with_ext);
+                }
+            }
         }
 
-        // 2. Project root
-        search_dirs.push(self.project_root.clone());
+        None
+    }
 
-        // 3. Common include directories
-        let common_include_dirs = vec![
-            "include",
-            "include/public",
-            "include/internal",
-            "src",
-            "src/include",
-            "public",
-            "private",
-            "headers",
-            "inc",
-        ];
+    /// Try to find a file in common include directories
+    fn find_include_file(&self, include_path: &str, from_file: &Path) -> Option<PathBuf> {
+        let normalized = self.normalize_path(include_path);
 
-        for dir_name in common_include_dirs {
-            let dir = self.project_root.join(dir_name);
-            if !search_dirs.contains(&dir) {
-                search_dirs.push(dir);
-            }
+        // 1. Same directory as the including file (highest priority for local includes)
+        let from_dir = from_file.parent();
+        if let Some(parent) = from_dir
+            && let Some(found) = Self::probe_dir(parent, &normalized)
+        {
+            return Some(found);
         }
 
-        // 4. Parent directories (for multi-level projects)
-        if let Some(parent) = from_file.parent() {
-            let mut current_parent = parent.to_path_buf();
-            let mut depth = 0;
-            loop {
-                if depth >= 5 {
-                    break;
-                }
-                if let Some(new_parent) = current_parent.parent() {
-                    if new_parent == current_parent {
-                        break;
-                    }
-                    if !search_dirs.contains(&current_parent) {
-                        search_dirs.push(current_parent.clone());
-                    }
-                    current_parent = new_parent.to_path_buf();
-                } else {
-                    break;
-                }
-                depth += 1;
+        // 2. Project root and common include directories, precomputed at map build
+        for dir in &self.base_search_dirs {
+            if let Some(found) = Self::probe_dir(dir, &normalized) {
+                return Some(found);
             }
         }
 
-        // Search for the include file in order of priority
-        for search_dir in search_dirs {
-            let candidate = search_dir.join(&normalized);
-            if candidate.exists() && candidate.is_file() {
-                return Some(candidate);
-            }
-
-            // Also check with different extensions for header files without extension
-            if !normalized.contains('.') {
-                let extensions = vec![".h", ".hpp", ".hxx", ".h++", ".cc", ".cpp", ".cxx", ".c++"];
-                for ext in extensions {
-                    let with_ext = search_dir.join(format!("{}{}", &normalized, ext));
-                    if with_ext.exists() && with_ext.is_file() {
-                        return Some(with_ext);
-                    }
+        // 3. Parent directories (for multi-level projects)
+        if let Some(parent) = from_dir {
+            for ancestor in parent.ancestors().skip(1).take(5) {
+                if let Some(found) = Self::probe_dir(ancestor, &normalized) {
+                    return Some(found);
                 }
             }
         }
@@ -318,6 +302,31 @@ impl LanguageResolver for CppResolver {
     fn build_module_map(&mut self, files: &[PathBuf], project_root: &Path) {
         self.project_root = project_root.to_path_buf();
 
+        // Drop mappings from any previous build so stale entries from another
+        // root can never satisfy a lookup
+        self.include_to_file.clear();
+        self.resolution_cache.get_mut().clear();
+
+        // Search directories that depend only on the root
+        const COMMON_INCLUDE_DIRS: &[&str] = &[
+            "include",
+            "include/public",
+            "include/internal",
+            "src",
+            "src/include",
+            "public",
+            "private",
+            "headers",
+            "inc",
+        ];
+        self.base_search_dirs.clear();
+        self.base_search_dirs.push(self.project_root.clone());
+        self.base_search_dirs.extend(
+            COMMON_INCLUDE_DIRS
+                .iter()
+                .map(|d| self.project_root.join(d)),
+        );
+
         for file_path in files {
             // Map relative paths from project root to file paths
             if let Ok(relative_path) = file_path.strip_prefix(&self.project_root) {
@@ -328,16 +337,41 @@ impl LanguageResolver for CppResolver {
     }
 
     fn resolve_import(&self, import_path: &str, from_file: &Path) -> Option<PathBuf> {
-        // Note: This is an immutable reference, so we can't update cache stats.
-        // In a real implementation with RefCell, we could track cache performance.
-
         // Check if this should be filtered (stdlib or external library)
         if self.should_filter_include(import_path) {
             return None; // Don't resolve system/external headers as they're external
         }
 
-        // Try to find the include file
-        self.find_include_file(import_path, from_file)
+        // Fast path: the map built from the project's own files answers most
+        // lookups without touching the filesystem. Keys are project-relative,
+        // so try the include relative to the including file's directory first
+        // (mirroring the search priority below), then relative to the root
+        if let Some(from_rel) = from_file
+            .parent()
+            .and_then(|p| p.strip_prefix(&self.project_root).ok())
+        {
+            let key = self.normalize_path(&from_rel.join(import_path).to_string_lossy());
+            if let Some(target) = self.include_to_file.get(&key) {
+                return Some(target.clone());
+            }
+        }
+        let key = self.normalize_path(import_path);
+        if let Some(target) = self.include_to_file.get(&key) {
+            return Some(target.clone());
+        }
+
+        // Fall back to probing the include directories on disk, memoizing
+        // the outcome per (directory, include) pair
+        let from_dir = from_file.parent().unwrap_or(Path::new("")).to_path_buf();
+        let cache_key = (from_dir, import_path.to_string());
+        if let Some(cached) = self.resolution_cache.borrow().get(&cache_key) {
+            return cached.clone();
+        }
+        let resolved = self.find_include_file(import_path, from_file);
+        self.resolution_cache
+            .borrow_mut()
+            .insert(cache_key, resolved.clone());
+        resolved
     }
 
     fn resolve_external_references(
@@ -513,6 +547,31 @@ mod tests {
         assert!(result.is_some());
     }
 
+    #[test]
+    fn test_resolution_cache_reuses_outcome() {
+        use std::fs;
+        use tempfile::TempDir;
+
+        let temp_dir = TempDir::new().expect("Failed to create temp dir");
+        let project_root = temp_dir.path();
+
+        let include_file = project_root.join("helper.h");
+        fs::write(&include_file, "// helper").expect("Failed to write include file");
+        let source_file = project_root.join("main.cpp");
+
+        // Empty module map forces the on-disk fallback path
+        let mut resolver = CppResolver::new();
+        resolver.build_module_map(&[], project_root);
+
+        let result = resolver.resolve_import("helper.h", &source_file);
+        assert_eq!(result, Some(include_file.clone()));
+
+        // Deleting the header doesn't change the answer: the memoized
+        // outcome is returned without re-probing the filesystem
+        fs::remove_file(&include_file).expect("Failed to remove include file");
+        assert_eq!(resolver.resolve_import("helper.h", &source_file), result);
+    }
+
     #[test]
     fn test_external_library_detection_boost() {
         let resolver = CppResolver::new();
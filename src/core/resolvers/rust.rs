@@ -103,6 +103,11 @@ impl LanguageResolver for RustResolver {
     fn build_module_map(&mut self, files: &[PathBuf], project_root: &Path) {
         self.project_root = project_root.to_path_buf();
 
+        // Drop mappings from any previous build so stale entries from another
+        // root can never satisfy a lookup
+        self.module_to_file.clear();
+        self.file_to_module.clear();
+
         for file_path in files {
             if let Some(module_path) = self.file_path_to_module_path(file_path) {
                 self.module_to_file
@@ -191,9 +196,14 @@ impl LanguageResolver for RustResolver {
     ) -> Vec<PathBuf> {
         let mut resolved = Vec::new();
 
+        // One scratch buffer for the "crate::" prefixing instead of a fresh
+        // format! allocation per reference
+        let mut potential_module = String::new();
         for ext_ref in references {
             // Try to resolve external references as module paths
-            let potential_module = format!("crate::{ext_ref}");
+            potential_module.clear();
+            potential_module.push_str("crate::");
+            potential_module.push_str(ext_ref);
 
             if let Some(target_file) = self.module_to_file.get(&potential_module) {
                 resolved.push(target_file.clone());
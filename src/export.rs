@@ -4,7 +4,7 @@ use font_kit::source::SystemSource;
 use fontdue::{Font, FontSettings};
 use std::collections::{HashMap, HashSet};
 use std::fs::File;
-use std::io::Write;
+use std::io::{BufWriter, Write as _};
 use std::path::Path;
 use svg::Document;
 use svg::node::element::{Circle, Line, Marker, Text, Title, path::Data};
@@ -16,42 +16,65 @@ const MIN_NODE_RADIUS: f32 = 20.0;
 const MAX_NODE_RADIUS: f32 = 40.0;
 const MARGIN: f32 = 50.0;
 
-pub fn export_graph_as_svg(
-    graph_nodes: &[GraphNode],
-    output_path: &Path,
-    detected_languages: HashSet<Language>,
-) -> Result<(), String> {
-    if graph_nodes.is_empty() {
-        return Ok(());
-    }
+/// Smallest and largest LOC across the graph, folded in a single pass
+fn loc_bounds(graph_nodes: &[GraphNode]) -> (u32, u32) {
+    graph_nodes.iter().fold((u32::MAX, 0), |(lo, hi), n| {
+        let loc = n.data().loc();
+        (lo.min(loc), hi.max(loc))
+    })
+}
 
-    // Calculate layout (similar to GUI layout)
+/// Node coordinates indexed by the node's order in `graph_nodes`
+type Positions = Vec<(f32, f32)>;
+/// Edges resolved to (source, target) node indices
+type EdgePairs = Vec<(usize, usize)>;
+
+/// Circular layout shared by both exporters: node positions indexed by the
+/// node's order in `graph_nodes`, plus every edge resolved to an
+/// (source, target) index pair so the render loops never touch paths.
+fn circular_positions(graph_nodes: &[GraphNode]) -> (Positions, EdgePairs) {
     let radius = (CANVAS_HEIGHT - 2.0 * MARGIN).min(CANVAS_WIDTH - 2.0 * MARGIN) * 0.4;
     let center_x = CANVAS_WIDTH / 2.0;
     let center_y = CANVAS_HEIGHT / 2.0;
     let n = graph_nodes.len();
 
-    // Calculate min/max LOC for node size normalization
-    let min_loc = graph_nodes
-        .iter()
-        .map(|n| n.data().loc())
-        .min()
-        .unwrap_or(0);
-    let max_loc = graph_nodes
-        .iter()
-        .map(|n| n.data().loc())
-        .max()
-        .unwrap_or(0);
-
-    // Calculate node positions
-    let mut positions = HashMap::new();
+    let mut positions = Vec::with_capacity(n);
+    let mut position_index = HashMap::with_capacity(n);
     for (i, node) in graph_nodes.iter().enumerate() {
         let angle = (i as f32) * (2.0 * std::f32::consts::PI / n as f32);
         let x = center_x + radius * angle.cos();
         let y = center_y + radius * angle.sin();
-        positions.insert(node.data().file(), (x, y));
+        positions.push((x, y));
+        position_index.insert(node.data().file(), i);
     }
 
+    let mut edge_pairs = Vec::new();
+    for (i, node) in graph_nodes.iter().enumerate() {
+        for edge in node.edges() {
+            if let Some(&j) = position_index.get(edge) {
+                edge_pairs.push((i, j));
+            }
+        }
+    }
+
+    (positions, edge_pairs)
+}
+
+pub fn export_graph_as_svg(
+    graph_nodes: &[GraphNode],
+    output_path: &Path,
+    detected_languages: HashSet<Language>,
+) -> Result<(), String> {
+    if graph_nodes.is_empty() {
+        return Ok(());
+    }
+
+    // Calculate min/max LOC for node size normalization in one pass
+    let (min_loc, max_loc) = loc_bounds(graph_nodes);
+
+    // Calculate node positions (similar to GUI layout)
+    let (positions, edge_pairs) = circular_positions(graph_nodes);
+
     // Create SVG document
     let mut document = Document::new()
         .set("width", CANVAS_WIDTH)
@@ -81,34 +104,30 @@ pub fn export_graph_as_svg(
     document = document.add(marker.add(arrow));
 
     // Add edges first (so they appear under nodes)
-    for node in graph_nodes {
-        let (start_x, start_y) = positions.get(node.data().file()).unwrap();
-
-        for edge in node.edges() {
-            if let Some((end_x, end_y)) = positions.get(edge) {
-                // Add the edge with the arrow marker
-                let edge = Line::new()
-                    .set("x1", *start_x)
-                    .set("y1", *start_y)
-                    .set("x2", *end_x)
-                    .set("y2", *end_y)
-                    .set("stroke", "lightblue")
-                    .set("stroke-width", 2)
-                    .set("marker-end", "url(#arrowhead)");
-                document = document.add(edge);
-            }
-        }
+    for &(i, j) in &edge_pairs {
+        let (start_x, start_y) = positions[i];
+        let (end_x, end_y) = positions[j];
+        // Add the edge with the arrow marker
+        let edge = Line::new()
+            .set("x1", start_x)
+            .set("y1", start_y)
+            .set("x2", end_x)
+            .set("y2", end_y)
+            .set("stroke", "lightblue")
+            .set("stroke-width", 2)
+            .set("marker-end", "url(#arrowhead)");
+        document = document.add(edge);
     }
 
     // Add nodes with labels
-    for node in graph_nodes {
-        let (x, y) = positions.get(node.data().file()).unwrap();
+    for (i, node) in graph_nodes.iter().enumerate() {
+        let (x, y) = positions[i];
         let radius = node.calculate_size(min_loc, max_loc, MIN_NODE_RADIUS, MAX_NODE_RADIUS, None);
 
         // Node circle
         let circle = Circle::new()
-            .set("cx", *x)
-            .set("cy", *y)
+            .set("cx", x)
+            .set("cy", y)
             .set("r", radius)
             .set("fill", node.data().language().color())
             .set("stroke", "black")
@@ -124,8 +143,8 @@ pub fn export_graph_as_svg(
             && let Some(name_str) = name.to_str()
         {
             let label = Text::new(name_str)
-                .set("x", *x)
-                .set("y", *y)
+                .set("x", x)
+                .set("y", y)
                 .set("text-anchor", "middle")
                 .set("dominant-baseline", "middle")
                 .set("font-family", "Arial")
@@ -163,10 +182,14 @@ pub fn export_graph_as_svg(
         document = document.add(text);
     }
 
-    // Save to file
-    let mut file = File::create(output_path).map_err(|e| e.to_string())?;
-    file.write_all(document.to_string().as_bytes())
-        .map_err(|e| e.to_string())?;
+    // Stream the document straight to disk; rendering it to one big String
+    // first would double-buffer the whole file in memory. Flush explicitly
+    // so a failed final write (e.g. disk full) surfaces as an error instead
+    // of vanishing in the BufWriter's drop
+    let file = File::create(output_path).map_err(|e| e.to_string())?;
+    let mut writer = BufWriter::new(file);
+    svg::write(&mut writer, &document).map_err(|e| e.to_string())?;
+    writer.flush().map_err(|e| e.to_string())?;
 
     Ok(())
 }
@@ -182,30 +205,10 @@ pub fn export_graph_as_png(
 
     let font = load_font()?;
 
-    // Layout math (unchanged from SVG version)
-    let radius = (CANVAS_HEIGHT - 2.0 * MARGIN).min(CANVAS_WIDTH - 2.0 * MARGIN) * 0.4;
-    let center_x = CANVAS_WIDTH / 2.0;
-    let center_y = CANVAS_HEIGHT / 2.0;
-    let n = graph_nodes.len();
-
-    let min_loc = graph_nodes
-        .iter()
-        .map(|n| n.data().loc())
-        .min()
-        .unwrap_or(0);
-    let max_loc = graph_nodes
-        .iter()
-        .map(|n| n.data().loc())
-        .max()
-        .unwrap_or(0);
+    let (min_loc, max_loc) = loc_bounds(graph_nodes);
 
-    let mut positions = std::collections::HashMap::new();
-    for (i, node) in graph_nodes.iter().enumerate() {
-        let angle = (i as f32) * (2.0 * std::f32::consts::PI / n as f32);
-        let x = center_x + radius * angle.cos();
-        let y = center_y + radius * angle.sin();
-        positions.insert(node.data().file(), (x, y));
-    }
+    // Layout math (unchanged from SVG version)
+    let (positions, edge_pairs) = circular_positions(graph_nodes);
 
     // Create pixmap (white background)
     let mut pixmap =
@@ -222,68 +225,73 @@ pub fn export_graph_as_png(
         ..Default::default()
     };
 
-    // Draw edges
-    for node in graph_nodes {
-        let (sx, sy) = positions[node.data().file()];
-        for edge in node.edges() {
-            if let Some(&(ex, ey)) = positions.get(edge) {
-                // Draw the main line
-                let mut pb = PathBuilder::new();
-                pb.move_to(sx, sy);
-                pb.line_to(ex, ey);
-                let path = pb.finish().unwrap();
-                pixmap.stroke_path(&path, &edge_paint, &stroke, Transform::identity(), None);
-
-                // Calculate arrow direction and points
-                let dx = ex - sx;
-                let dy = ey - sy;
-                let length = (dx * dx + dy * dy).sqrt();
-                if length > 0.0 {
-                    let arrow_size = 10.0;
-                    let arrow_angle = 0.5f32; // ~30 degrees in radians
-
-                    // Normalize direction vector
-                    let dir_x = dx / length;
-                    let dir_y = dy / length;
-
-                    // Calculate arrow tip position (pulled back from end point)
-                    let tip_x = ex - dir_x * 20.0;
-                    let tip_y = ey - dir_y * 20.0;
-
-                    // Calculate arrow wing points
-                    let left_x = tip_x
-                        + arrow_size * (-dir_x * arrow_angle.cos() + dir_y * arrow_angle.sin());
-                    let left_y = tip_y
-                        + arrow_size * (-dir_x * arrow_angle.sin() - dir_y * arrow_angle.cos());
-                    let right_x = tip_x
-                        + arrow_size * (-dir_x * arrow_angle.cos() - dir_y * arrow_angle.sin());
-                    let right_y = tip_y
-                        + arrow_size * (dir_x * arrow_angle.sin() - dir_y * arrow_angle.cos());
-
-                    // Draw arrowhead
-                    let mut arrow_pb = PathBuilder::new();
-                    arrow_pb.move_to(ex, ey);
-                    arrow_pb.line_to(left_x, left_y);
-                    arrow_pb.line_to(right_x, right_y);
-                    arrow_pb.close();
-
-                    if let Some(arrow_path) = arrow_pb.finish() {
-                        pixmap.fill_path(
-                            &arrow_path,
-                            &edge_paint,
-                            FillRule::Winding,
-                            Transform::identity(),
-                            None,
-                        );
-                    }
-                }
-            }
+    // Draw edges: accumulate every line into one path and every arrowhead into
+    // another, so the rasterizer runs once per batch instead of once per edge
+    let mut lines_pb = PathBuilder::new();
+    let mut arrows_pb = PathBuilder::new();
+
+    for &(i, j) in &edge_pairs {
+        let (sx, sy) = positions[i];
+        let (ex, ey) = positions[j];
+        // The main line
+        lines_pb.move_to(sx, sy);
+        lines_pb.line_to(ex, ey);
+
+        // Calculate arrow direction and points
+        let dx = ex - sx;
+        let dy = ey - sy;
+        let length = (dx * dx + dy * dy).sqrt();
+        if length > 0.0 {
+            let arrow_size = 10.0;
+            let arrow_angle = 0.5f32; // ~30 degrees in radians
+
+            // Normalize direction vector
+            let dir_x = dx / length;
+            let dir_y = dy / length;
+
+            // Calculate arrow tip position (pulled back from end point)
+            let tip_x = ex - dir_x * 20.0;
+            let tip_y = ey - dir_y * 20.0;
+
+            // Calculate arrow wing points
+            let left_x =
+                tip_x + arrow_size * (-dir_x * arrow_angle.cos() + dir_y * arrow_angle.sin());
+            let left_y =
+                tip_y + arrow_size * (-dir_x * arrow_angle.sin() - dir_y * arrow_angle.cos());
+            let right_x =
+                tip_x + arrow_size * (-dir_x * arrow_angle.cos() - dir_y * arrow_angle.sin());
+            let right_y =
+                tip_y + arrow_size * (dir_x * arrow_angle.sin() - dir_y * arrow_angle.cos());
+
+            arrows_pb.move_to(ex, ey);
+            arrows_pb.line_to(left_x, left_y);
+            arrows_pb.line_to(right_x, right_y);
+            arrows_pb.close();
         }
     }
 
+    if let Some(lines_path) = lines_pb.finish() {
+        pixmap.stroke_path(
+            &lines_path,
+            &edge_paint,
+            &stroke,
+            Transform::identity(),
+            None,
+        );
+    }
+    if let Some(arrows_path) = arrows_pb.finish() {
+        pixmap.fill_path(
+            &arrows_path,
+            &edge_paint,
+            FillRule::Winding,
+            Transform::identity(),
+            None,
+        );
+    }
+
     // Draw nodes
-    for node in graph_nodes {
-        let (x, y) = positions[node.data().file()];
+    for (i, node) in graph_nodes.iter().enumerate() {
+        let (x, y) = positions[i];
         let node_radius =
             node.calculate_size(min_loc, max_loc, MIN_NODE_RADIUS, MAX_NODE_RADIUS, None);
 
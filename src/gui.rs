@@ -6,11 +6,15 @@ use eframe::egui;
 use egui::{Rect, Response, Sense, Ui, Vec2, pos2, vec2};
 use petgraph::{Graph, graph::NodeIndex};
 use std::collections::HashMap;
+use std::path::PathBuf;
 
 mod camera;
 
 pub struct SeiriGraph {
     pub graph_nodes: Vec<GraphNode>,
+    /// Node index by file path, so edge targets resolve in O(1) instead of a
+    /// linear scan over all nodes
+    file_index: HashMap<PathBuf, usize>,
 
     // View state
     camera_pos: Vec2,
@@ -19,6 +23,7 @@ pub struct SeiriGraph {
     // Node layout
     node_positions: Vec<Vec2>,
     layout_type: LayoutType,
+    layout_cache: HashMap<LayoutType, Vec<Vec2>>,
 
     // Interaction state
     selected_node: Option<usize>,
@@ -33,6 +38,18 @@ pub struct SeiriGraph {
     // Node size calculation
     min_loc: u32,
     max_loc: u32,
+    node_radii: Vec<f32>,
+    node_base_colors: Vec<egui::Color32>,
+    /// Display labels (file stems), derived once instead of per frame
+    node_names: Vec<String>,
+    /// Node indices each node's edges resolve to, flattened CSR-style:
+    /// node i's targets live at edge_targets[edge_offsets[i]..edge_offsets[i + 1]]
+    edge_targets: Vec<usize>,
+    edge_offsets: Vec<usize>,
+    /// Indices of the nodes that depend on each node (reverse adjacency),
+    /// in the same flattened layout
+    incoming_edges: Vec<usize>,
+    incoming_offsets: Vec<usize>,
 
     // Graph analysis
     graph_analysis: Option<GraphAnalysis>,
@@ -42,24 +59,74 @@ impl SeiriGraph {
     pub fn new(graph_nodes: Vec<GraphNode>) -> Self {
         let n = graph_nodes.len();
 
-        // Calculate min/max LOC
-        let min_loc = graph_nodes
+        let file_index: HashMap<PathBuf, usize> = graph_nodes
             .iter()
-            .map(|n| n.data().loc())
-            .min()
-            .unwrap_or(0);
-        let max_loc = graph_nodes
+            .enumerate()
+            .map(|(i, node)| (node.data().file().clone(), i))
+            .collect();
+
+        // Resolve every edge's target path to its node index once up front:
+        // forward adjacency for drawing/layout, reverse adjacency for the
+        // details panel. Both sides are stored CSR-style — one flat index
+        // array plus per-node offsets — so the per-frame edge walk touches
+        // two contiguous allocations instead of a Vec per node
+        let mut edge_offsets = vec![0usize; n + 1];
+        let mut incoming_offsets = vec![0usize; n + 1];
+        let mut resolved: Vec<(usize, usize)> = Vec::new();
+        for (i, node) in graph_nodes.iter().enumerate() {
+            for edge in node.edges() {
+                if let Some(&j) = file_index.get(edge) {
+                    resolved.push((i, j));
+                    edge_offsets[i + 1] += 1;
+                    incoming_offsets[j + 1] += 1;
+                }
+            }
+        }
+        for i in 0..n {
+            edge_offsets[i + 1] += edge_offsets[i];
+            incoming_offsets[i + 1] += incoming_offsets[i];
+        }
+        let mut edge_targets = vec![0usize; resolved.len()];
+        let mut incoming_edges = vec![0usize; resolved.len()];
+        let mut out_cursor = edge_offsets.clone();
+        let mut in_cursor = incoming_offsets.clone();
+        for &(i, j) in &resolved {
+            edge_targets[out_cursor[i]] = j;
+            out_cursor[i] += 1;
+            incoming_edges[in_cursor[j]] = i;
+            in_cursor[j] += 1;
+        }
+
+        let node_names = graph_nodes
             .iter()
-            .map(|n| n.data().loc())
-            .max()
-            .unwrap_or(0);
+            .map(|node| {
+                node.data()
+                    .file()
+                    .file_stem()
+                    .and_then(|s| s.to_str())
+                    .unwrap_or_default()
+                    .to_string()
+            })
+            .collect();
+
+        // Calculate min/max LOC in one pass
+        let (min_loc, max_loc) = if graph_nodes.is_empty() {
+            (0, 0)
+        } else {
+            graph_nodes.iter().fold((u32::MAX, 0), |(lo, hi), node| {
+                let loc = node.data().loc();
+                (lo.min(loc), hi.max(loc))
+            })
+        };
 
         let mut app = Self {
             graph_nodes,
+            file_index,
             camera_pos: Vec2::ZERO,
             camera: Camera::default(),
             node_positions: vec![Vec2::ZERO; n],
             layout_type: LayoutType::default(),
+            layout_cache: HashMap::new(),
             selected_node: None,
             hovered_node: None,
             min_node_radius: 20.0,
@@ -68,18 +135,39 @@ impl SeiriGraph {
             show_dependencies: true,
             min_loc,
             max_loc,
+            node_radii: vec![0.0; n],
+            node_base_colors: vec![egui::Color32::GRAY; n],
+            node_names,
+            edge_targets,
+            edge_offsets,
+            incoming_edges,
+            incoming_offsets,
             graph_analysis: None,
         };
         app.initialize_positions();
         app
     }
 
+    /// Outgoing neighbors of `node` in the flattened adjacency
+    fn targets_of(&self, node: usize) -> &[usize] {
+        &self.edge_targets[self.edge_offsets[node]..self.edge_offsets[node + 1]]
+    }
+
     fn initialize_positions(&mut self) {
         let n = self.graph_nodes.len();
         if n == 0 {
             return;
         }
 
+        // The graph never changes within a session, so a layout only needs to be
+        // computed once; switching back to a previous layout reuses its positions
+        if let Some(cached) = self.layout_cache.get(&self.layout_type) {
+            self.node_positions.clone_from(cached);
+            self.camera_pos = egui::Vec2::ZERO;
+            self.camera.reset();
+            return;
+        }
+
         // Create a graph for layout
         let mut graph = Graph::new();
         let mut node_indices = Vec::with_capacity(n);
@@ -89,10 +177,12 @@ impl SeiriGraph {
             node_indices.push(graph.add_node(()));
         }
 
-        // Add edges based on dependencies
-        for (from_idx, node) in self.graph_nodes.iter().enumerate() {
-            for (dep_idx, _edge) in node.edges().iter().enumerate() {
-                graph.add_edge(node_indices[from_idx], node_indices[dep_idx], ());
+        // Add edges based on dependencies, using the resolved target indices
+        // (the old code wired every edge to its position in the edge list
+        // rather than the node it pointed at)
+        for from_idx in 0..n {
+            for &to_idx in self.targets_of(from_idx) {
+                graph.add_edge(node_indices[from_idx], node_indices[to_idx], ());
             }
         }
 
@@ -137,142 +227,175 @@ impl SeiriGraph {
             }
         }
 
-        // Analyze graph structure
-        self.graph_analysis = Some(GraphAnalysis::analyze_graph(&graph));
+        self.layout_cache
+            .insert(self.layout_type, self.node_positions.clone());
+
+        // Analyze graph structure. The analysis only depends on the graph, not
+        // the layout, so it survives layout switches; compute it exactly once
+        if self.graph_analysis.is_none() {
+            self.graph_analysis = Some(GraphAnalysis::analyze_graph(&graph));
+            self.compute_node_radii();
+            self.compute_node_colors();
+        }
 
         // Reset camera and zoom to frame the layout
         self.camera_pos = egui::Vec2::ZERO;
         self.camera.reset();
     }
 
-    fn get_node_color(&self, index: usize) -> egui::Color32 {
-        let node = &self.graph_nodes[index];
-        let is_external = !node.data().file().exists();
-        let in_largest_scc = self
-            .graph_analysis
-            .as_ref()
-            .map(|analysis| analysis.is_in_largest_scc(NodeIndex::new(index)))
-            .unwrap_or(false);
-
-        // change base color based on node type
-        let base_color = if in_largest_scc {
-            egui::Color32::from_rgb(255, 100, 100) // Red for SCC nodes
-        } else if is_external {
-            egui::Color32::from_hex(node.data().language().color()).unwrap_or(egui::Color32::GRAY)
-        } else {
-            egui::Color32::from_hex(node.data().language().color())
-                .map(|c| c.gamma_multiply(0.5))
-                .unwrap_or(egui::Color32::GRAY)
-        };
+    /// Precompute the world-space radius of every node. Radii only depend on
+    /// LOC bounds and betweenness centrality, so recomputing them per frame or
+    /// per pointer event (as the hover/pan/click handlers used to) was waste.
+    fn compute_node_radii(&mut self) {
+        for (i, node) in self.graph_nodes.iter().enumerate() {
+            let betweenness_score = self
+                .graph_analysis
+                .as_ref()
+                .and_then(|analysis| analysis.get_betweenness_centrality(NodeIndex::new(i)));
+
+            self.node_radii[i] = node.calculate_size(
+                self.min_loc,
+                self.max_loc,
+                self.min_node_radius,
+                self.max_node_radius,
+                betweenness_score,
+            );
+        }
+    }
+
+    /// Precompute each node's base color. Parsing the language hex color and
+    /// stat-ing the file to see whether it is external are both too expensive
+    /// to redo per node per frame; only the selection/hover overrides are
+    /// per-frame state.
+    fn compute_node_colors(&mut self) {
+        for (index, node) in self.graph_nodes.iter().enumerate() {
+            let is_external = !node.data().file().exists();
+            let in_largest_scc = self
+                .graph_analysis
+                .as_ref()
+                .map(|analysis| analysis.is_in_largest_scc(NodeIndex::new(index)))
+                .unwrap_or(false);
+
+            // change base color based on node type
+            self.node_base_colors[index] = if in_largest_scc {
+                egui::Color32::from_rgb(255, 100, 100) // Red for SCC nodes
+            } else if is_external {
+                egui::Color32::from_hex(node.data().language().color())
+                    .unwrap_or(egui::Color32::GRAY)
+            } else {
+                egui::Color32::from_hex(node.data().language().color())
+                    .map(|c| c.gamma_multiply(0.5))
+                    .unwrap_or(egui::Color32::GRAY)
+            };
+        }
+    }
 
+    fn get_node_color(&self, index: usize) -> egui::Color32 {
         if Some(index) == self.selected_node {
             egui::Color32::ORANGE
         } else if Some(index) == self.hovered_node {
             egui::Color32::LIGHT_BLUE
         } else {
-            base_color
+            self.node_base_colors[index]
         }
     }
 
     fn draw_graph(&mut self, ui: &mut Ui, canvas_rect: &Rect) {
         let painter = ui.painter_at(*canvas_rect);
 
-        // Draw edges first (behind nodes)
+        // Zoom is constant for the whole frame; hoist it (and the sqrt used
+        // for stroke widths) out of the per-edge and per-node loops
+        let zoom = self.camera.zoom_level();
+        let zoom_sqrt = zoom.sqrt();
+
+        // Draw edges first (behind nodes), batched into a single shape list so the
+        // painter gets one extend() call instead of two tessellation requests per edge
         if self.show_dependencies {
-            for (i, node) in self.graph_nodes.iter().enumerate() {
+            let mut edge_shapes: Vec<egui::Shape> = Vec::new();
+
+            for i in 0..self.node_positions.len() {
+                let targets = self.targets_of(i);
+                if targets.is_empty() {
+                    continue;
+                }
                 let from_pos = self
                     .camera
                     .world_to_screen(self.node_positions[i].to_pos2(), canvas_rect);
 
-                for edge_file in node.edges() {
-                    if let Some(j) = self
-                        .graph_nodes
-                        .iter()
-                        .position(|n| n.data().file() == edge_file)
+                for &j in targets {
+                    let to_pos = self
+                        .camera
+                        .world_to_screen(self.node_positions[j].to_pos2(), canvas_rect);
+
+                    // Only draw if both nodes are visible
+                    if canvas_rect.contains(egui::pos2(from_pos.x, from_pos.y))
+                        || canvas_rect.contains(egui::pos2(to_pos.x, to_pos.y))
                     {
-                        let to_pos = self
-                            .camera
-                            .world_to_screen(self.node_positions[j].to_pos2(), canvas_rect);
-
-                        // Only draw if both nodes are visible
-                        if canvas_rect.contains(egui::pos2(from_pos.x, from_pos.y))
-                            || canvas_rect.contains(egui::pos2(to_pos.x, to_pos.y))
-                        {
-                            let edge_color =
-                                if Some(i) == self.selected_node || Some(j) == self.selected_node {
-                                    egui::Color32::from_rgb(255, 150, 50)
-                                } else {
-                                    egui::Color32::from_rgba_premultiplied(100, 150, 200, 80)
-                                };
-
-                            // Draw the main line
-                            painter.line_segment(
-                                [
-                                    egui::pos2(from_pos.x, from_pos.y),
-                                    egui::pos2(to_pos.x, to_pos.y),
-                                ],
-                                egui::Stroke::new(
-                                    2.0 * self.camera.zoom_level().sqrt(),
-                                    edge_color,
-                                ),
-                            );
-
-                            // Calculate arrow direction
-                            let dir = (to_pos - from_pos).normalized();
-                            let arrow_size = 10.0 * self.camera.zoom_level().sqrt();
-                            let arrow_angle: f32 = 0.5; // ~30 degrees in radians
-
-                            // Calculate arrowhead points
-                            let arrow_end = to_pos - dir * (20.0 * self.camera.zoom_level().sqrt()); // Pull back from the end
-                            let left = arrow_end
-                                + arrow_size
-                                    * vec2(
-                                        -dir.x * arrow_angle.cos() + dir.y * arrow_angle.sin(),
-                                        -dir.x * arrow_angle.sin() - dir.y * arrow_angle.cos(),
-                                    );
-                            let right = arrow_end
-                                + arrow_size
-                                    * vec2(
-                                        -dir.x * arrow_angle.cos() - dir.y * arrow_angle.sin(),
-                                        dir.x * arrow_angle.sin() - dir.y * arrow_angle.cos(),
-                                    );
-
-                            // Draw arrowhead
-                            painter.add(egui::Shape::convex_polygon(
-                                vec![
-                                    pos2(to_pos.x, to_pos.y),
-                                    pos2(left.x, left.y),
-                                    pos2(right.x, right.y),
-                                ],
-                                edge_color,
-                                egui::Stroke::new(1.0, edge_color),
-                            ));
-                        }
+                        let edge_color =
+                            if Some(i) == self.selected_node || Some(j) == self.selected_node {
+                                egui::Color32::from_rgb(255, 150, 50)
+                            } else {
+                                egui::Color32::from_rgba_premultiplied(100, 150, 200, 80)
+                            };
+
+                        // The main line
+                        edge_shapes.push(egui::Shape::line_segment(
+                            [
+                                egui::pos2(from_pos.x, from_pos.y),
+                                egui::pos2(to_pos.x, to_pos.y),
+                            ],
+                            egui::Stroke::new(2.0 * zoom_sqrt, edge_color),
+                        ));
+
+                        // Calculate arrow direction
+                        let dir = (to_pos - from_pos).normalized();
+                        let arrow_size = 10.0 * zoom_sqrt;
+                        let arrow_angle: f32 = 0.5; // ~30 degrees in radians
+
+                        // Calculate arrowhead points
+                        let arrow_end = to_pos - dir * (20.0 * zoom_sqrt); // Pull back from the end
+                        let left = arrow_end
+                            + arrow_size
+                                * vec2(
+                                    -dir.x * arrow_angle.cos() + dir.y * arrow_angle.sin(),
+                                    -dir.x * arrow_angle.sin() - dir.y * arrow_angle.cos(),
+                                );
+                        let right = arrow_end
+                            + arrow_size
+                                * vec2(
+                                    -dir.x * arrow_angle.cos() - dir.y * arrow_angle.sin(),
+                                    dir.x * arrow_angle.sin() - dir.y * arrow_angle.cos(),
+                                );
+
+                        // Arrowhead
+                        edge_shapes.push(egui::Shape::convex_polygon(
+                            vec![
+                                pos2(to_pos.x, to_pos.y),
+                                pos2(left.x, left.y),
+                                pos2(right.x, right.y),
+                            ],
+                            edge_color,
+                            egui::Stroke::new(1.0, edge_color),
+                        ));
                     }
                 }
             }
+
+            painter.extend(edge_shapes);
         }
 
-        // Draw nodes
-        for (i, node) in self.graph_nodes.iter().enumerate() {
+        // Draw nodes: batch the circles (shadow, fill, border) into one shape list,
+        // then draw labels on top
+        let mut node_shapes: Vec<egui::Shape> = Vec::new();
+        let mut visible_nodes: Vec<(usize, egui::Pos2, f32, egui::Color32)> = Vec::new();
+
+        for (i, _) in self.graph_nodes.iter().enumerate() {
             let screen_pos = self
                 .camera
                 .world_to_screen(self.node_positions[i].to_pos2(), canvas_rect);
 
             // Only draw visible nodes
-            let betweenness_score = self
-                .graph_analysis
-                .as_ref()
-                .and_then(|analysis| analysis.get_betweenness_centrality(NodeIndex::new(i)));
-
-            let base_radius = self.graph_nodes[i].calculate_size(
-                self.min_loc,
-                self.max_loc,
-                self.min_node_radius,
-                self.max_node_radius,
-                betweenness_score,
-            );
-            let node_radius = base_radius * self.camera.zoom_level();
+            let node_radius = self.node_radii[i] * zoom;
             if !canvas_rect.expand(node_radius).contains(screen_pos) {
                 continue;
             }
@@ -280,12 +403,12 @@ impl SeiriGraph {
             let color = self.get_node_color(i);
 
             // Node circle with subtle shadow
-            painter.circle_filled(
-                screen_pos + vec2(2.0, 2.0) * self.camera.zoom_level(),
+            node_shapes.push(egui::Shape::circle_filled(
+                screen_pos + vec2(2.0, 2.0) * zoom,
                 node_radius,
                 egui::Color32::from_black_alpha(30),
-            );
-            painter.circle_filled(screen_pos, node_radius, color);
+            ));
+            node_shapes.push(egui::Shape::circle_filled(screen_pos, node_radius, color));
 
             // Node border
             let border_color = if Some(i) == self.selected_node {
@@ -293,18 +416,22 @@ impl SeiriGraph {
             } else {
                 egui::Color32::from_rgb(60, 60, 60)
             };
-            painter.circle_stroke(
+            node_shapes.push(egui::Shape::circle_stroke(
                 screen_pos,
                 node_radius,
-                egui::Stroke::new(2.0 * self.camera.zoom_level().sqrt(), border_color),
-            );
+                egui::Stroke::new(2.0 * zoom_sqrt, border_color),
+            ));
 
-            // Node label with background for better readability
-            if self.show_labels
-                && self.camera.zoom_level() > 0.3
-                && let Some(name) = node.data().file().file_stem().and_then(|s| s.to_str())
-            {
-                let font_size = (12.0 * self.camera.zoom_level()).clamp(8.0, 16.0);
+            visible_nodes.push((i, screen_pos, node_radius, color));
+        }
+
+        painter.extend(node_shapes);
+
+        // Node labels with background for better readability
+        for (i, screen_pos, node_radius, color) in visible_nodes {
+            let name = self.node_names[i].as_str();
+            if self.show_labels && zoom > 0.3 && !name.is_empty() {
+                let font_size = (12.0 * zoom).clamp(8.0, 16.0);
 
                 // Measure text to create appropriate background
                 let font_id = egui::FontId::proportional(font_size);
@@ -312,23 +439,20 @@ impl SeiriGraph {
                     painter.layout_no_wrap(name.to_string(), font_id.clone(), egui::Color32::WHITE);
                 let text_rect = egui::Rect::from_center_size(
                     screen_pos,
-                    text_galley.size() + vec2(6.0, 4.0) * self.camera.zoom_level(),
+                    text_galley.size() + vec2(6.0, 4.0) * zoom,
                 );
 
                 // Only draw background if text is wider than the node
                 if text_galley.size().x > node_radius * 1.5 {
                     painter.rect_filled(
                         text_rect,
-                        4.0 * self.camera.zoom_level(),
+                        4.0 * zoom,
                         egui::Color32::from_black_alpha(180),
                     );
                     painter.rect_stroke(
                         text_rect,
-                        4.0 * self.camera.zoom_level(),
-                        egui::Stroke::new(
-                            1.0 * self.camera.zoom_level(),
-                            egui::Color32::from_gray(100),
-                        ),
+                        4.0 * zoom,
+                        egui::Stroke::new(1.0 * zoom, egui::Color32::from_gray(100)),
                         egui::StrokeKind::Middle,
                     );
                 }
@@ -378,19 +502,7 @@ impl SeiriGraph {
             for (i, _) in self.graph_nodes.iter().enumerate() {
                 let dist = (world_mouse - self.node_positions[i]).to_vec2().length();
 
-                // TODO: insanely inefficient, please change this someday
-                let betweenness_score = self
-                    .graph_analysis
-                    .as_ref()
-                    .and_then(|analysis| analysis.get_betweenness_centrality(NodeIndex::new(i)));
-
-                let node_radius = self.graph_nodes[i].calculate_size(
-                    self.min_loc,
-                    self.max_loc,
-                    self.min_node_radius,
-                    self.max_node_radius,
-                    betweenness_score,
-                );
+                let node_radius = self.node_radii[i];
                 if dist < node_radius {
                     self.hovered_node = Some(i);
                     return;
@@ -436,19 +548,7 @@ impl SeiriGraph {
             for (i, _) in self.graph_nodes.iter().enumerate() {
                 let dist = (world_mouse - self.node_positions[i]).to_vec2().length();
 
-                // TODO: insanely inefficient, please change this someday
-                let betweenness_score = self
-                    .graph_analysis
-                    .as_ref()
-                    .and_then(|analysis| analysis.get_betweenness_centrality(NodeIndex::new(i)));
-
-                let node_radius = self.graph_nodes[i].calculate_size(
-                    self.min_loc,
-                    self.max_loc,
-                    self.min_node_radius,
-                    self.max_node_radius,
-                    betweenness_score,
-                );
+                let node_radius = self.node_radii[i];
                 if dist < node_radius {
                     response.dnd_set_drag_payload(i);
                     break;
@@ -483,19 +583,7 @@ impl SeiriGraph {
                     .to_vec2()
                     .length();
 
-                // TODO: insanely inefficient, please change this someday
-                let betweenness_score = self
-                    .graph_analysis
-                    .as_ref()
-                    .and_then(|analysis| analysis.get_betweenness_centrality(NodeIndex::new(i)));
-
-                let node_radius = self.graph_nodes[i].calculate_size(
-                    self.min_loc,
-                    self.max_loc,
-                    self.min_node_radius,
-                    self.max_node_radius,
-                    betweenness_score,
-                );
+                let node_radius = self.node_radii[i];
                 if dist < node_radius {
                     self.selected_node = Some(i);
                     return;
@@ -671,17 +759,15 @@ impl SeiriGraph {
         ui.group(|ui| {
             ui.strong("Dependencies");
 
-            let incoming: Vec<_> = self
-                .graph_nodes
-                .iter()
-                .enumerate()
-                .filter(|(_, n)| n.edges().contains(node.file()))
-                .collect();
+            // Sliced inline so only the adjacency fields are borrowed; the
+            // click handler below still needs to write selected_node
+            let incoming = &self.incoming_edges
+                [self.incoming_offsets[selected_idx]..self.incoming_offsets[selected_idx + 1]];
             let outgoing = self.graph_nodes[selected_idx].edges();
 
             ui.collapsing(format!("📥 Incoming ({})", incoming.len()), |ui| {
-                for (idx, dep_node) in incoming {
-                    let name = dep_node
+                for &idx in incoming {
+                    let name = self.graph_nodes[idx]
                         .data()
                         .file()
                         .file_name()
@@ -695,11 +781,7 @@ impl SeiriGraph {
 
             ui.collapsing(format!("📤 Outgoing ({})", outgoing.len()), |ui| {
                 for edge in outgoing {
-                    if let Some(idx) = self
-                        .graph_nodes
-                        .iter()
-                        .position(|n| n.data().file() == edge)
-                    {
+                    if let Some(&idx) = self.file_index.get(edge) {
                         let name = edge
                             .file_name()
                             .and_then(|n| n.to_str())
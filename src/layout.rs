@@ -6,7 +6,7 @@ use petgraph::graph::{Graph, NodeIndex};
 use std::collections::HashMap;
 use sugiyama::{SugiyamaConfig, SugiyamaLayout};
 
-#[derive(Debug, Clone, Copy, PartialEq, Default)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Default)]
 pub enum LayoutType {
     #[default]
     Circular,
@@ -8,6 +8,9 @@ use std::collections::{HashMap, HashSet, VecDeque};
 pub struct SugiyamaConfig {
     /// Maximum number of iterations for crossing minimization
     pub max_iterations: usize,
+    /// Node count above which crossing minimization is skipped entirely;
+    /// the sweep is quadratic per layer and dominates on large graphs
+    pub crossing_reduction_limit: usize,
     /// Minimum horizontal distance between nodes in the same layer
     pub node_spacing: f32,
     /// Vertical distance between layers
@@ -20,6 +23,7 @@ impl Default for SugiyamaConfig {
     fn default() -> Self {
         Self {
             max_iterations: 50,
+            crossing_reduction_limit: 500,
             node_spacing: 120.0,
             layer_spacing: 150.0,
             scale_factor: 1.5,
@@ -27,13 +31,11 @@ impl Default for SugiyamaConfig {
     }
 }
 
-/// A node in the layered graph with positioning information
+/// A node in the layered graph
 #[derive(Debug, Clone, Default)]
 struct LayeredNode {
     id: NodeIndex,
     layer: usize,
-    #[allow(dead_code)]
-    position: f32,
     is_dummy: bool,
 }
 
@@ -42,7 +44,6 @@ impl LayeredNode {
         Self {
             id,
             layer,
-            position: 0.0,
             is_dummy,
         }
     }
@@ -182,17 +183,23 @@ impl SugiyamaLayout {
         let mut new_edges = Vec::new();
         let mut dummy_nodes = Vec::new();
 
-        for layer_idx in 0..layers.len() - 1 {
-            for node in &layers[layer_idx] {
+        // Index each node's layer once; the inner loop used to rescan every
+        // layer for every neighbor
+        let node_layers: HashMap<NodeIndex, usize> = layers
+            .iter()
+            .enumerate()
+            .flat_map(|(layer_idx, layer)| layer.iter().map(move |n| (n.id, layer_idx)))
+            .collect();
+
+        let last_layer = layers.len() - 1;
+        for (layer_idx, layer) in layers.iter().enumerate().take(last_layer) {
+            for node in layer {
                 let neighbors: Vec<_> = dag
                     .neighbors_directed(node.id, Direction::Outgoing)
                     .collect();
 
                 for &neighbor in &neighbors {
-                    let target_layer = layers
-                        .iter()
-                        .position(|l| l.iter().any(|n| n.id == neighbor))
-                        .unwrap();
+                    let target_layer = node_layers[&neighbor];
 
                     if target_layer > layer_idx + 1 {
                         // Create dummy nodes for long edges
@@ -230,12 +237,19 @@ impl SugiyamaLayout {
     ) -> usize {
         let mut crossings = 0;
 
+        // Index the lower layer once instead of scanning it for every neighbor pair
+        let layer2_positions: HashMap<NodeIndex, usize> = layer2
+            .iter()
+            .enumerate()
+            .map(|(pos, n)| (n.id, pos))
+            .collect();
+
         for (i1, n1) in layer1.iter().enumerate() {
             for (i2, n2) in layer1.iter().enumerate().skip(i1 + 1) {
                 for n1_neighbor in dag.neighbors_directed(n1.id, Direction::Outgoing) {
                     for n2_neighbor in dag.neighbors_directed(n2.id, Direction::Outgoing) {
-                        let pos1 = layer2.iter().position(|n| n.id == n1_neighbor);
-                        let pos2 = layer2.iter().position(|n| n.id == n2_neighbor);
+                        let pos1 = layer2_positions.get(&n1_neighbor);
+                        let pos2 = layer2_positions.get(&n2_neighbor);
 
                         if let (Some(p1), Some(p2)) = (pos1, pos2)
                             && (i1 < i2) != (p1 < p2)
@@ -368,8 +382,12 @@ impl Layout for SugiyamaLayout {
         // Step 3: Add dummy nodes for long edges
         self.expand_long_edges(&mut dag, &mut layers);
 
-        // Step 4: Reduce edge crossings
-        self.reduce_crossings(&mut layers, &dag);
+        // Step 4: Reduce edge crossings. On large graphs the sweep costs more
+        // than it is worth visually, so fall back to the degree-sorted ordering
+        // from assign_layers instead.
+        if dag.node_count() <= self.config.crossing_reduction_limit {
+            self.reduce_crossings(&mut layers, &dag);
+        }
 
         // Step 5: Assign coordinates
         self.assign_coordinates(&dag, &layers)
@@ -90,8 +90,8 @@ fn detect_file_language(
     language_files: &mut HashMap<PathBuf, Language>,
     detected_langs: &mut HashSet<Language>,
 ) {
-    if let Some(file_language) = Language::from_file(target_file.to_str().unwrap()) {
-        language_files.insert(target_file.clone(), file_language);
+    if let Some(file_language) = Language::from_path(&target_file) {
+        language_files.insert(target_file, file_language);
         detected_langs.insert(file_language);
     }
 }
@@ -127,73 +127,57 @@ fn run(args: Cli) -> Result<(), String> {
     // Detect languages in file/project
     let mut language_files: HashMap<PathBuf, Language> = HashMap::new();
     let files_to_process = walk_directory(&project_path, no_gitignore);
-    let detected_languages = detect_project_languages(&files_to_process, &mut language_files)
+    let detected_languages = detect_project_languages(files_to_process, &mut language_files)
         .ok_or_else(|| "No supported language files found in the project".to_string())?;
 
     // Parse files and collect Nodes, indexed by file path
-    let mut node_map: HashMap<PathBuf, FileNode> = HashMap::new();
-    for (file_path, lang) in &language_files {
-        match lang {
-            Language::Python => {
-                if let Some(node) = parse_python_file(file_path) {
-                    if verbose {
-                        println!("Parsed Python file: {}", file_path.display());
-                    }
-                    node_map.insert(file_path.clone(), node);
-                }
-            }
-            Language::Rust => {
-                if let Some(node) = parse_rust_file(file_path) {
-                    if verbose {
-                        println!("Parsed Rust file: {}", file_path.display());
-                    }
-                    node_map.insert(file_path.clone(), node);
-                }
-            }
-            Language::TypeScript => {
-                if let Some(node) = parse_typescript_file(file_path) {
-                    if verbose {
-                        println!("Parsed TypeScript file: {}", file_path.display());
-                    }
-                    node_map.insert(file_path.clone(), node);
-                }
-            }
-            Language::Cpp => {
-                if let Some(node) = parse_cpp_file(file_path) {
-                    if verbose {
-                        println!("Parsed C++ file: {}", file_path.display());
-                    }
-                    node_map.insert(file_path.clone(), node);
-                }
-            }
-        }
-    }
+    let node_map = parse_files(&language_files, verbose);
 
     // Build GraphNodes with multi-language support
     let mut graph_builder = GraphBuilder::new();
-    let graph_nodes = graph_builder.build_graph_edges(&node_map, &project_path);
+    let graph_nodes = graph_builder.build_graph_edges(node_map, &project_path);
 
     if verbose {
-        println!("\nResolved {} nodes with connections:", graph_nodes.len());
+        // Assemble the whole report in memory and write it once; a println!
+        // per line locks and flushes stdout every call, which dominates on
+        // large graphs
+        use std::fmt::Write as _;
+
+        let mut report = String::new();
+        let _ = writeln!(
+            report,
+            "\nResolved {} nodes with connections:",
+            graph_nodes.len()
+        );
         for gnode in &graph_nodes {
-            println!(
+            let _ = writeln!(
+                report,
                 "  {} ({:?}):",
                 gnode.data().file().file_name().unwrap().to_string_lossy(),
                 gnode.data().language(),
             );
-            println!("    Functions: {}", gnode.data().functions().len());
-            println!("    Containers: {}", gnode.data().containers().len());
-            println!("    Imports: {}", gnode.data().imports().len());
-            println!("    Dependencies: {}", gnode.edges().len());
+            let _ = writeln!(report, "    Functions: {}", gnode.data().functions().len());
+            let _ = writeln!(
+                report,
+                "    Containers: {}",
+                gnode.data().containers().len()
+            );
+            let _ = writeln!(report, "    Imports: {}", gnode.data().imports().len());
+            let _ = writeln!(report, "    Dependencies: {}", gnode.edges().len());
 
             if !gnode.edges().is_empty() {
-                println!("    Depends on:");
+                let _ = writeln!(report, "    Depends on:");
                 for edge in gnode.edges() {
-                    println!("      -> {}", edge.file_name().unwrap().to_string_lossy());
+                    let _ = writeln!(
+                        report,
+                        "      -> {}",
+                        edge.file_name().unwrap().to_string_lossy()
+                    );
                 }
             }
-            println!();
+            let _ = writeln!(report);
         }
+        print!("{report}");
     }
 
     // launch the visualization or export if specified
@@ -247,14 +231,109 @@ fn run(args: Cli) -> Result<(), String> {
     Ok(())
 }
 
+/// Language-specific parse entry point, resolved once per file
+type ParseFn = fn(&PathBuf) -> Option<FileNode>;
+
+/// Map a language to its parse function so the dispatch happens once per
+/// file list instead of re-matching inside every worker iteration
+fn parser_for(lang: Language) -> ParseFn {
+    // Thin closures rather than the generic fn items directly, so each
+    // instantiation coerces to a lifetime-generic fn pointer
+    match lang {
+        Language::Python => |p| parse_python_file(p),
+        Language::Rust => |p| parse_rust_file(p),
+        Language::TypeScript => |p| parse_typescript_file(p),
+        Language::Cpp => |p| parse_cpp_file(p),
+    }
+}
+
+/// Parse all detected files across worker threads.
+///
+/// Parsing is CPU-bound and every file is independent, so workers pull the
+/// next file from a shared counter until the list is exhausted.
+fn parse_files(
+    language_files: &HashMap<PathBuf, Language>,
+    verbose: bool,
+) -> HashMap<PathBuf, FileNode> {
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    let mut files: Vec<(&PathBuf, &Language, ParseFn)> = language_files
+        .iter()
+        .map(|(path, lang)| (path, lang, parser_for(*lang)))
+        .collect();
+    if files.is_empty() {
+        return HashMap::new();
+    }
+
+    // Hand out the biggest files first so a large file claimed late can't
+    // leave one worker parsing alone after the others have drained the queue.
+    // The cached key keeps the metadata call at one per file rather than one
+    // per comparison
+    files.sort_by_cached_key(|(path, _, _)| {
+        std::cmp::Reverse(std::fs::metadata(path).map(|m| m.len()).unwrap_or(0))
+    });
+
+    let worker_count = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+        .min(files.len());
+
+    let next = AtomicUsize::new(0);
+    let mut node_map: HashMap<PathBuf, FileNode> = HashMap::with_capacity(files.len());
+
+    std::thread::scope(|scope| {
+        let mut handles = Vec::with_capacity(worker_count);
+        for _ in 0..worker_count {
+            handles.push(scope.spawn(|| {
+                use std::fmt::Write as _;
+
+                let mut parsed = Vec::new();
+                // Verbose output is accumulated per worker and written once
+                // after join: a println per file means a stdout lock per file,
+                // and interleaves lines from concurrent workers
+                let mut log = String::new();
+                loop {
+                    let i = next.fetch_add(1, Ordering::Relaxed);
+                    let Some(&(file_path, lang, parse)) = files.get(i) else {
+                        break;
+                    };
+
+                    if let Some(node) = parse(file_path) {
+                        if verbose {
+                            let _ = writeln!(
+                                log,
+                                "Parsed {} file: {}",
+                                lang.to_string(),
+                                file_path.display()
+                            );
+                        }
+                        parsed.push((file_path.clone(), node));
+                    }
+                }
+                (parsed, log)
+            }));
+        }
+
+        for handle in handles {
+            let (parsed, log) = handle.join().expect("parser worker panicked");
+            if verbose {
+                print!("{log}");
+            }
+            node_map.extend(parsed);
+        }
+    });
+
+    node_map
+}
+
 fn detect_project_languages(
-    files_to_process: &[PathBuf],
+    files_to_process: Vec<PathBuf>,
     language_files: &mut HashMap<PathBuf, Language>,
 ) -> Option<HashSet<Language>> {
     let mut detected: HashSet<Language> = HashSet::new();
     files_to_process
-        .iter()
-        .for_each(|entry| detect_file_language(entry.to_path_buf(), language_files, &mut detected));
+        .into_iter()
+        .for_each(|entry| detect_file_language(entry, language_files, &mut detected));
 
     if detected.is_empty() {
         None
@@ -264,8 +343,6 @@ fn detect_project_languages(
 }
 
 fn walk_directory(path: &Path, no_gitignore: bool) -> Vec<PathBuf> {
-    let mut paths = Vec::new();
-
     let mut builder = WalkBuilder::new(path);
     if no_gitignore {
         builder
@@ -282,20 +359,28 @@ fn walk_directory(path: &Path, no_gitignore: bool) -> Vec<PathBuf> {
         }
     }
 
-    for result in builder.build() {
-        match result {
-            Ok(entry) => {
-                if let Some(file_type) = entry.file_type()
-                    && file_type.is_file()
-                {
-                    paths.push(entry.path().to_path_buf());
+    // Walk the tree with the crate's parallel walker so directory reads (and
+    // gitignore matching) overlap; entries are funneled back over a channel
+    let (sender, receiver) = std::sync::mpsc::channel::<PathBuf>();
+    builder.build_parallel().run(|| {
+        let sender = sender.clone();
+        Box::new(move |result| {
+            match result {
+                Ok(entry) => {
+                    if let Some(file_type) = entry.file_type()
+                        && file_type.is_file()
+                    {
+                        let _ = sender.send(entry.into_path());
+                    }
                 }
+                Err(msg) => eprintln!("Error reading entry: {msg}"),
             }
-            Err(msg) => eprintln!("Error reading entry: {msg}"),
-        }
-    }
+            ignore::WalkState::Continue
+        })
+    });
+    drop(sender);
 
-    paths
+    receiver.into_iter().collect()
 }
 
 #[cfg(test)]
@@ -430,7 +515,7 @@ mod tests {
 
         let mut language_files: HashMap<PathBuf, Language> = HashMap::new();
         let files_to_process = walk_directory(&current_dir, false);
-        let result = detect_project_languages(&files_to_process, &mut language_files);
+        let result = detect_project_languages(files_to_process, &mut language_files);
 
         assert!(&result.is_some());
 
@@ -505,7 +590,7 @@ mod tests {
         // Parse all C++ files
         let mut language_files: HashMap<PathBuf, Language> = HashMap::new();
         let files_to_process = walk_directory(temp_dir.path(), true);
-        detect_project_languages(&files_to_process, &mut language_files);
+        detect_project_languages(files_to_process, &mut language_files);
 
         // Only process C++ files
         let cpp_files: Vec<_> = language_files
@@ -530,7 +615,7 @@ mod tests {
 
         // Build graph
         let mut graph_builder = GraphBuilder::new();
-        let graph_nodes = graph_builder.build_graph_edges(&node_map, temp_dir.path());
+        let graph_nodes = graph_builder.build_graph_edges(node_map, temp_dir.path());
         assert!(
             !graph_nodes.is_empty(),
             "Graph should have nodes after building edges"
@@ -628,7 +713,7 @@ mod tests {
         // Parse files
         let mut language_files: HashMap<PathBuf, Language> = HashMap::new();
         let files_to_process = walk_directory(temp_dir.path(), true);
-        let detected_languages = detect_project_languages(&files_to_process, &mut language_files)
+        let detected_languages = detect_project_languages(files_to_process, &mut language_files)
             .expect("Should detect languages");
 
         let mut node_map: HashMap<PathBuf, FileNode> = HashMap::new();
@@ -644,7 +729,7 @@ mod tests {
 
         // Build graph
         let mut graph_builder = GraphBuilder::new();
-        let graph_nodes = graph_builder.build_graph_edges(&node_map, temp_dir.path());
+        let graph_nodes = graph_builder.build_graph_edges(node_map, temp_dir.path());
         assert!(
             !graph_nodes.is_empty(),
             "Graph should have nodes after building edges"
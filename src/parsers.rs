@@ -2,3 +2,27 @@ pub mod cpp;
 pub mod python;
 pub mod rust;
 pub mod typescript;
+
+/// Expands to the per-language parser state every module needs: the grammar
+/// converted once behind a `Lazy`, and one reusable `Parser` per thread,
+/// since constructing a parser and loading the grammar per file is pure
+/// overhead. Keeps the four language modules from each carrying an
+/// identical copy of this boilerplate.
+macro_rules! thread_local_parser {
+    ($grammar:expr, $lang:literal) => {
+        static GRAMMAR: once_cell::sync::Lazy<tree_sitter::Language> =
+            once_cell::sync::Lazy::new(|| $grammar.into());
+
+        thread_local! {
+            static PARSER: std::cell::RefCell<tree_sitter::Parser> =
+                std::cell::RefCell::new({
+                    let mut parser = tree_sitter::Parser::new();
+                    parser
+                        .set_language(&GRAMMAR)
+                        .expect(concat!("Error loading ", $lang, " grammar"));
+                    parser
+                });
+        }
+    };
+}
+pub(crate) use thread_local_parser;
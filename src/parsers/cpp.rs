@@ -2,16 +2,19 @@ use crate::core::defs::{FileNode, Import, Language};
 use std::collections::HashSet;
 use std::fs;
 use std::path::Path;
-use tree_sitter::Parser;
 use tree_sitter_cpp as ts_cpp;
 
+super::thread_local_parser!(ts_cpp::LANGUAGE, "C++");
+
 /// Helper function to get node text
-fn get_text(n: tree_sitter::Node, code: &str) -> String {
-    n.utf8_text(code.as_bytes()).unwrap_or("").to_string()
+#[inline]
+fn get_text(n: tree_sitter::Node, code: &[u8]) -> String {
+    n.utf8_text(code).unwrap_or("").to_string()
 }
 
 /// Determine if an include is local (quoted) vs system (angle brackets)
 #[allow(dead_code)]
+#[inline]
 fn is_local_include(include_path: &str) -> bool {
     // This is determined when parsing #include directives
     // For now, we'll use a simple heuristic: if it starts with a dot or doesn't look like a stdlib header
@@ -20,6 +23,7 @@ fn is_local_include(include_path: &str) -> bool {
 
 /// Check if an include is a standard library header
 #[allow(dead_code)]
+#[inline]
 fn is_system_include(include_path: &str) -> bool {
     // Common C/C++ standard library headers
     const STDLIB_HEADERS: &[&str] = &[
@@ -81,7 +85,7 @@ fn is_system_include(include_path: &str) -> bool {
 }
 
 /// Extract include path from #include directive
-fn extract_include_path(node: tree_sitter::Node, code: &str) -> Option<(String, bool)> {
+fn extract_include_path(node: tree_sitter::Node, code: &[u8]) -> Option<(String, bool)> {
     // For #include directives, the structure is:
     // preproc_include -> string_literal or system_lib_string
     let mut cursor = node.walk();
@@ -123,7 +127,7 @@ fn is_in_conditional_block(node: tree_sitter::Node) -> bool {
 
 /// Extract conditional directive condition (e.g., "DEBUG" from "#ifdef DEBUG")
 #[allow(dead_code)]
-fn extract_conditional_condition(node: tree_sitter::Node, code: &str) -> Option<String> {
+fn extract_conditional_condition(node: tree_sitter::Node, code: &[u8]) -> Option<String> {
     let mut cursor = node.walk();
     for child in node.children(&mut cursor) {
         if child.kind() == "identifier" {
@@ -177,14 +181,12 @@ fn extract_macro_includes(code: &str) -> HashSet<Import> {
 }
 
 pub fn parse_cpp_file<P: AsRef<Path>>(path: P) -> Option<FileNode> {
-    let code = fs::read_to_string(&path).ok()?;
-    let loc = code.matches('\n').count() as u32 + 1;
-
-    let mut parser = Parser::new();
-    parser
-        .set_language(&ts_cpp::LANGUAGE.into())
-        .expect("Error loading C++ grammar");
-    let tree = parser.parse(&code, None)?;
+    // Read raw bytes; tree-sitter parses byte slices and token text is decoded
+    // lazily, so there is no need to validate the whole file as UTF-8 up front
+    let code = fs::read(&path).ok()?;
+    let loc = code.iter().filter(|&&b| b == b'\n').count() as u32 + 1;
+
+    let tree = PARSER.with(|parser| parser.borrow_mut().parse(&code, None))?;
     let root_node = tree.root_node();
 
     let mut imports = HashSet::new();
@@ -193,59 +195,46 @@ pub fn parse_cpp_file<P: AsRef<Path>>(path: P) -> Option<FileNode> {
     let external_references = HashSet::new();
 
     // Traverse the syntax tree
-    let mut cursor = root_node.walk();
     let mut stack = vec![root_node];
 
     while let Some(node) = stack.pop() {
-        // Push children onto stack for DFS
-        let mut node_cursor = node.walk();
-        for child in node.children(&mut node_cursor) {
-            stack.push(child);
-        }
+        let kind = node.kind();
 
-        match node.kind() {
-            "preproc_include" => {
-                // Extract include path
-                if let Some((include_path, is_local)) = extract_include_path(node, &code) {
-                    imports.insert(Import::new(include_path, is_local));
-                }
+        if kind == "preproc_include" {
+            // Extract include path
+            if let Some((include_path, is_local)) = extract_include_path(node, &code) {
+                imports.insert(Import::new(include_path, is_local));
             }
-            "function_definition" => {
+        }
+
+        // Single pass over the children: extract the declarator/name (if this
+        // node carries one) while pushing them for the DFS, instead of walking
+        // the child list once per concern
+        let wants_function = kind == "function_definition";
+        let wants_container = matches!(
+            kind,
+            "class_specifier" | "struct_specifier" | "union_specifier" | "enum_specifier"
+        );
+        let mut name_found = false;
+
+        let mut node_cursor = node.walk();
+        for child in node.children(&mut node_cursor) {
+            if wants_function && !name_found && child.kind() == "function_declarator" {
                 // Extract function name
-                if let Some(declarator_node) = node
-                    .children(&mut cursor)
-                    .find(|n| n.kind() == "function_declarator")
-                {
-                    let mut decl_cursor = declarator_node.walk();
-                    for child in declarator_node.children(&mut decl_cursor) {
-                        if child.kind() == "identifier" {
-                            functions.insert(get_text(child, &code));
-                            break;
-                        }
-                    }
-                }
-            }
-            "class_specifier" | "struct_specifier" | "union_specifier" => {
-                // Extract class/struct/union name
-                let mut spec_cursor = node.walk();
-                for child in node.children(&mut spec_cursor) {
-                    if child.kind() == "identifier" {
-                        containers.insert(get_text(child, &code));
+                let mut decl_cursor = child.walk();
+                for decl_child in child.children(&mut decl_cursor) {
+                    if decl_child.kind() == "identifier" {
+                        functions.insert(get_text(decl_child, &code));
                         break;
                     }
                 }
+                name_found = true;
+            } else if wants_container && !name_found && child.kind() == "identifier" {
+                // Extract class/struct/union/enum name
+                containers.insert(get_text(child, &code));
+                name_found = true;
             }
-            "enum_specifier" => {
-                // Extract enum name
-                let mut enum_cursor = node.walk();
-                for child in node.children(&mut enum_cursor) {
-                    if child.kind() == "identifier" {
-                        containers.insert(get_text(child, &code));
-                        break;
-                    }
-                }
-            }
-            _ => {}
+            stack.push(child);
         }
     }
 
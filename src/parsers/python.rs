@@ -2,12 +2,20 @@ use crate::core::defs::{FileNode, Import, Language};
 use std::collections::HashSet;
 use std::fs;
 use std::path::Path;
-use tree_sitter::Parser;
 use tree_sitter_python as ts_python;
 
+super::thread_local_parser!(ts_python::LANGUAGE, "Python");
+
 /// Helper function to get node text
-fn get_text(n: tree_sitter::Node, code: &str) -> String {
-    n.utf8_text(code.as_bytes()).unwrap_or("").to_string()
+#[inline]
+fn get_text(n: tree_sitter::Node, code: &[u8]) -> String {
+    get_str(n, code).to_string()
+}
+
+/// Borrow node text straight from the source without allocating
+#[inline]
+fn get_str<'a>(n: tree_sitter::Node, code: &'a [u8]) -> &'a str {
+    n.utf8_text(code).unwrap_or("")
 }
 
 /// Determine if an import is local
@@ -36,8 +44,24 @@ fn is_local_import(import_path: &str, file_path: &Path) -> bool {
     false
 }
 
+/// Join a dotted_name node's identifier parts straight into one "x.y.z"
+/// string, rather than collecting a Vec of parts and joining it
+fn dotted_name_text(node: tree_sitter::Node, code: &[u8]) -> String {
+    let mut path = String::new();
+    let mut cursor = node.walk();
+    for part in node.children(&mut cursor) {
+        if part.kind() == "identifier" {
+            if !path.is_empty() {
+                path.push('.');
+            }
+            path.push_str(get_str(part, code));
+        }
+    }
+    path
+}
+
 /// Extract import path from an import statement
-fn extract_import_path(node: tree_sitter::Node, code: &str) -> Vec<String> {
+fn extract_import_path(node: tree_sitter::Node, code: &[u8]) -> Vec<String> {
     let mut imports = Vec::new();
     let mut cursor = node.walk();
 
@@ -47,28 +71,16 @@ fn extract_import_path(node: tree_sitter::Node, code: &str) -> Vec<String> {
             for child in node.children(&mut cursor) {
                 match child.kind() {
                     "dotted_name" => {
-                        let mut path = Vec::new();
-                        let mut name_cursor = child.walk();
-                        for name_part in child.children(&mut name_cursor) {
-                            if name_part.kind() == "identifier" {
-                                path.push(get_text(name_part, code));
-                            }
-                        }
+                        let path = dotted_name_text(child, code);
                         if !path.is_empty() {
-                            imports.push(path.join("."));
+                            imports.push(path);
                         }
                     }
                     "aliased_import" => {
                         if let Some(name_node) = child.child_by_field_name("name") {
-                            let mut path = Vec::new();
-                            let mut name_cursor = name_node.walk();
-                            for name_part in name_node.children(&mut name_cursor) {
-                                if name_part.kind() == "identifier" {
-                                    path.push(get_text(name_part, code));
-                                }
-                            }
+                            let path = dotted_name_text(name_node, code);
                             if !path.is_empty() {
-                                imports.push(path.join("."));
+                                imports.push(path);
                             }
                         }
                     }
@@ -84,15 +96,9 @@ fn extract_import_path(node: tree_sitter::Node, code: &str) -> Vec<String> {
             for child in node.children(&mut cursor) {
                 match child.kind() {
                     "dotted_name" => {
-                        let mut parts = Vec::new();
-                        let mut name_cursor = child.walk();
-                        for name_part in child.children(&mut name_cursor) {
-                            if name_part.kind() == "identifier" {
-                                parts.push(get_text(name_part, code));
-                            }
-                        }
-                        if !parts.is_empty() {
-                            from_path = parts.join(".");
+                        let path = dotted_name_text(child, code);
+                        if !path.is_empty() {
+                            from_path = path;
                         }
                         imports.push(get_text(child, code));
                     }
@@ -133,14 +139,12 @@ fn extract_import_path(node: tree_sitter::Node, code: &str) -> Vec<String> {
 }
 
 pub fn parse_python_file<P: AsRef<Path>>(path: P) -> Option<FileNode> {
-    let code = fs::read_to_string(&path).ok()?;
-    let loc = code.matches("\n").count() as u32 + 1; // count number of newlines bc code.lines() has failed me
-
-    let mut parser = Parser::new();
-    parser
-        .set_language(&ts_python::LANGUAGE.into())
-        .expect("Error loading Python grammar");
-    let tree = parser.parse(&code, None)?;
+    // Read raw bytes; tree-sitter parses byte slices and token text is decoded
+    // lazily, so there is no need to validate the whole file as UTF-8 up front
+    let code = fs::read(&path).ok()?;
+    let loc = code.iter().filter(|&&b| b == b'\n').count() as u32 + 1; // count number of newlines bc code.lines() has failed me
+
+    let tree = PARSER.with(|parser| parser.borrow_mut().parse(&code, None))?;
     let root_node = tree.root_node();
 
     let mut imports = HashSet::new();
@@ -153,7 +157,8 @@ pub fn parse_python_file<P: AsRef<Path>>(path: P) -> Option<FileNode> {
     let mut stack = vec![root_node];
 
     while let Some(node) = stack.pop() {
-        match node.kind() {
+        let kind = node.kind();
+        match kind {
             "import_statement" | "import_from_statement" => {
                 // Handle both "import foo" and "from foo import bar"
                 let import_paths = extract_import_path(node, &code);
@@ -169,13 +174,36 @@ pub fn parse_python_file<P: AsRef<Path>>(path: P) -> Option<FileNode> {
                     }
                 }
             }
-            "function_definition" => {
-                // Get function name
-                if let Some(name_node) = node
-                    .children(&mut cursor)
-                    .find(|n| n.kind() == "identifier")
-                {
-                    let name = get_text(name_node, &code);
+            "attribute" | "call" => {
+                // Collect external references from attribute access and function calls.
+                // The same chains recur constantly, so check membership on the
+                // borrowed text and only allocate for genuinely new entries
+                let text = get_str(node, &code);
+                if !text.starts_with('_') && !external_references.contains(text) {
+                    // Only include public attributes/calls
+                    external_references.insert(text.to_string());
+                }
+            }
+            _ => {}
+        }
+
+        // Import statements were fully handled above and cannot contain any
+        // other kind we match, so skip descending into their subtrees
+        if matches!(kind, "import_statement" | "import_from_statement") {
+            continue;
+        }
+
+        // Single pass over the children: grab the definition name (if this node
+        // is one) while pushing them for the DFS, instead of walking them twice
+        let wants_name = matches!(kind, "function_definition" | "class_definition");
+        let mut name_found = false;
+        for child in node.children(&mut cursor) {
+            if wants_name && !name_found && child.kind() == "identifier" {
+                name_found = true;
+                let name = get_text(child, &code);
+                if kind == "class_definition" {
+                    containers.insert(name);
+                } else {
                     let in_function = node.parent().is_some_and(|p| p.kind() == "block")
                         && node
                             .parent()
@@ -187,26 +215,6 @@ pub fn parse_python_file<P: AsRef<Path>>(path: P) -> Option<FileNode> {
                     }
                 }
             }
-            "class_definition" => {
-                if let Some(name_node) = node
-                    .children(&mut cursor)
-                    .find(|n| n.kind() == "identifier")
-                {
-                    containers.insert(get_text(name_node, &code));
-                }
-            }
-            "attribute" | "call" => {
-                // Collect external references from attribute access and function calls
-                let text = get_text(node, &code);
-                if !text.starts_with('_') {
-                    // Only include public attributes/calls
-                    external_references.insert(text);
-                }
-            }
-            _ => {}
-        }
-
-        for child in node.children(&mut cursor) {
             stack.push(child);
         }
     }
@@ -2,87 +2,96 @@ use crate::core::defs::{FileNode, Import, Language};
 use std::collections::HashSet;
 use std::fs;
 use std::path::Path;
-use tree_sitter::Parser;
 use tree_sitter_rust as ts_rust;
 
+super::thread_local_parser!(ts_rust::LANGUAGE, "Rust");
+
 /// Get node text
-fn get_text(n: tree_sitter::Node, code: &str) -> String {
-    n.utf8_text(code.as_bytes()).unwrap_or("").to_string()
+#[inline]
+fn get_text(n: tree_sitter::Node, code: &[u8]) -> String {
+    n.utf8_text(code).unwrap_or("").to_string()
 }
 
 /// Determine if an import is local (starts with crate/self/super or current mod)
+#[inline]
 fn is_local_import(import_path: &str, file_path: &Path) -> bool {
     import_path.starts_with("crate::")
         || import_path.starts_with("self::")
         || import_path.starts_with("super::")
         || {
-            // Also treat module-relative imports as local (e.g., modname::foo)
-            if let Some(stem) = file_path.file_stem().and_then(|s| s.to_str()) {
-                import_path.starts_with(&format!("{stem}::"))
-            } else {
-                false
-            }
+            // Also treat module-relative imports as local (e.g., modname::foo);
+            // strip_prefix avoids formatting a "stem::" String per call
+            file_path
+                .file_stem()
+                .and_then(|s| s.to_str())
+                .and_then(|stem| import_path.strip_prefix(stem))
+                .is_some_and(|rest| rest.starts_with("::"))
         }
 }
 
 /// Extract all import paths from a use declaration, handling use lists
-fn extract_use_paths(node: tree_sitter::Node, code: &str) -> Vec<String> {
+fn extract_use_paths(node: tree_sitter::Node, code: &[u8]) -> Vec<String> {
     let mut paths = Vec::new();
     extract_paths_from_use_clause(node, code, &mut paths);
     paths
 }
 
-fn parse_use_list(node: tree_sitter::Node, code: &str, _prefix: &str) -> Vec<String> {
+// The prefix is one shared buffer: each scoped level pushes its segments
+// while recursing and truncates back on the way out, instead of copying the
+// accumulated prefix into a fresh String per nesting level.
+
+fn parse_use_list(
+    node: tree_sitter::Node,
+    code: &[u8],
+    prefix: &mut String,
+    paths: &mut Vec<String>,
+) {
     let mut cursor = node.walk();
-    let mut imports: Vec<String> = vec![];
 
     for child in node.children(&mut cursor) {
         match child.kind() {
             "identifier" | "scoped_identifier" => {
-                imports.push(get_text(child, code));
+                paths.push(format!("{prefix}{}", get_text(child, code)));
             }
             "scoped_use_list" => {
-                for s in parse_scoped_use_list(child, code, "") {
-                    imports.push(s.to_string());
-                }
+                parse_scoped_use_list(child, code, prefix, paths);
             }
             _ => {}
         }
     }
-
-    imports
 }
 
-fn parse_scoped_use_list(node: tree_sitter::Node, code: &str, prefix: &str) -> Vec<String> {
-    let mut imports: Vec<String> = vec![];
-    let mut new_prefix = prefix.to_string();
+fn parse_scoped_use_list(
+    node: tree_sitter::Node,
+    code: &[u8],
+    prefix: &mut String,
+    paths: &mut Vec<String>,
+) {
+    let base_len = prefix.len();
     let mut cursor = node.walk();
 
     for child in node.children(&mut cursor) {
         match child.kind() {
             "crate" | "identifier" | "scoped_identifier" => {
-                new_prefix.push_str(&(get_text(child, code) + "::"));
+                prefix.push_str(&get_text(child, code));
+                prefix.push_str("::");
             }
             "use_list" => {
-                parse_use_list(child, code, &new_prefix)
-                    .iter()
-                    .for_each(|s| imports.push(new_prefix.clone() + s));
+                parse_use_list(child, code, prefix, paths);
             }
             "scoped_use_list" => {
-                parse_scoped_use_list(child, code, &new_prefix)
-                    .iter()
-                    .for_each(|s| imports.push(new_prefix.clone() + s));
+                parse_scoped_use_list(child, code, prefix, paths);
             }
             "::" => {} // skip
             _ => {}
         }
     }
 
-    imports
+    prefix.truncate(base_len);
 }
 
 /// Recursively extract paths from a use clause, building up the prefix
-fn extract_paths_from_use_clause(node: tree_sitter::Node, code: &str, paths: &mut Vec<String>) {
+fn extract_paths_from_use_clause(node: tree_sitter::Node, code: &[u8], paths: &mut Vec<String>) {
     let mut cursor = node.walk();
     for child in node.children(&mut cursor) {
         match child.kind() {
@@ -93,9 +102,7 @@ fn extract_paths_from_use_clause(node: tree_sitter::Node, code: &str, paths: &mu
                 paths.push(get_text(child, code));
             }
             "scoped_use_list" => {
-                parse_scoped_use_list(child, code, "")
-                    .iter()
-                    .for_each(|s| paths.push(s.to_string()));
+                parse_scoped_use_list(child, code, &mut String::new(), paths);
             }
             "use_as_clause" => {
                 // Handle `foo as bar` - we want the original name (foo)
@@ -113,21 +120,21 @@ fn extract_paths_from_use_clause(node: tree_sitter::Node, code: &str, paths: &mu
 
 fn parser_loop<P: AsRef<Path>>(
     path: P,
-    code: &str,
+    code: &[u8],
     root_node: tree_sitter::Node<'_>,
 ) -> Option<FileNode> {
-    let loc = code.matches("\n").count() as u32 + 1; // count number of newlines bc code.lines() has failed me
+    let loc = code.iter().filter(|&&b| b == b'\n').count() as u32 + 1;
 
     let mut imports = HashSet::new();
     let mut functions = HashSet::new();
     let mut containers = HashSet::new();
     let mut external_references = HashSet::new();
 
-    let mut cursor = root_node.walk();
     let mut stack = vec![root_node];
 
     while let Some(node) = stack.pop() {
-        match node.kind() {
+        let kind = node.kind();
+        match kind {
             "use_declaration" => {
                 let import_paths = extract_use_paths(node, code);
                 for import_path in import_paths {
@@ -137,44 +144,6 @@ fn parser_loop<P: AsRef<Path>>(
                     }
                 }
             }
-            "mod_item" => {
-                // Handle module declarations like "pub mod python;" or "mod utils;"
-                let mut mod_name = String::new();
-                let mut is_declaration = false;
-
-                for child in node.children(&mut cursor) {
-                    if child.kind() == "identifier" {
-                        mod_name = get_text(child, code);
-                    } else if child.kind() == ";" {
-                        // If we find a semicolon, this is a module declaration (not inline definition)
-                        is_declaration = true;
-                    }
-                }
-
-                // Only add as import if it's a declaration (has semicolon)
-                if !mod_name.is_empty() && is_declaration {
-                    imports.insert(Import::new(mod_name, true));
-                }
-            }
-            "function_item" | "function_signature_item" => {
-                // Get function name - look for the first identifier after any visibility modifiers
-                let mut cursor = node.walk();
-                for child in node.children(&mut cursor) {
-                    if child.kind() == "identifier" {
-                        let name = get_text(child, code);
-                        functions.insert(name);
-                    }
-                }
-            }
-            "struct_item" | "enum_item" | "trait_item" | "impl_item" => {
-                let mut cursor = node.walk();
-                for child in node.children(&mut cursor) {
-                    if child.kind() == "type_identifier" {
-                        let name = get_text(child, code);
-                        containers.insert(name);
-                    }
-                }
-            }
             // For external references, look for scoped identifiers (e.g., foo::bar)
             "scoped_identifier" => {
                 let text = get_text(node, code);
@@ -183,11 +152,38 @@ fn parser_loop<P: AsRef<Path>>(
             _ => {}
         }
 
-        // push children onto stack
+        // Single pass over the children: extract names for the item kinds that
+        // carry them while pushing for the DFS, instead of walking the child
+        // list once per match arm. Only named nodes matter both for the names
+        // and for what the DFS can match, so anonymous tokens are skipped
+        let is_mod = kind == "mod_item";
+        let wants_function = matches!(kind, "function_item" | "function_signature_item");
+        let wants_container = matches!(
+            kind,
+            "struct_item" | "enum_item" | "trait_item" | "impl_item"
+        );
+
+        // Module declarations like "pub mod python;" or "mod utils;"
+        let mut mod_name = String::new();
+
         let mut child_cursor = node.walk();
-        for child in node.children(&mut child_cursor) {
+        for child in node.named_children(&mut child_cursor) {
+            if is_mod && child.kind() == "identifier" {
+                mod_name = get_text(child, code);
+            } else if wants_function && child.kind() == "identifier" {
+                // Function name - the first identifier after any visibility modifiers
+                functions.insert(get_text(child, code));
+            } else if wants_container && child.kind() == "type_identifier" {
+                containers.insert(get_text(child, code));
+            }
             stack.push(child);
         }
+
+        // Only add as import if it's a declaration: a mod item with no body
+        // field ends in a semicolon and pulls in the module's file
+        if is_mod && !mod_name.is_empty() && node.child_by_field_name("body").is_none() {
+            imports.insert(Import::new(mod_name, true));
+        }
     }
 
     Some(FileNode::new(
@@ -201,15 +197,27 @@ fn parser_loop<P: AsRef<Path>>(
     ))
 }
 
+/// Files above this size are memory-mapped rather than read into a buffer,
+/// letting the kernel page them in on demand
+const MMAP_THRESHOLD: u64 = 64 * 1024;
+
 /// Parse a Rust file and extract its structure
 pub fn parse_rust_file<P: AsRef<Path>>(path: P) -> Option<FileNode> {
-    let code = fs::read_to_string(&path).ok()?;
+    let file = fs::File::open(&path).ok()?;
+    if file.metadata().ok()?.len() > MMAP_THRESHOLD {
+        // SAFETY: the map is read-only and dropped before this function
+        // returns; a concurrent truncation of the file mid-parse is the
+        // usual (accepted) mmap caveat
+        let code = unsafe { memmap2::Mmap::map(&file).ok()? };
+        let tree = PARSER.with(|parser| parser.borrow_mut().parse(&code[..], None))?;
+        return parser_loop(path, &code, tree.root_node());
+    }
+
+    // Raw bytes: tree-sitter consumes &[u8] directly, so decoding to a
+    // String would only add a UTF-8 validation pass
+    let code = fs::read(&path).ok()?;
 
-    let mut parser = Parser::new();
-    parser
-        .set_language(&ts_rust::LANGUAGE.into())
-        .expect("Error loading Rust grammar");
-    let tree = parser.parse(&code, None)?;
+    let tree = PARSER.with(|parser| parser.borrow_mut().parse(&code, None))?;
     let root_node = tree.root_node();
 
     parser_loop(path, &code, root_node)
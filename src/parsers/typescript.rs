@@ -2,35 +2,36 @@ use crate::core::defs::{FileNode, Import, Language};
 use std::collections::HashSet;
 use std::fs;
 use std::path::Path;
-use tree_sitter::Parser;
 use tree_sitter_typescript as ts_typescript;
 
+super::thread_local_parser!(ts_typescript::LANGUAGE_TYPESCRIPT, "TypeScript");
+
 /// Get node text
-fn get_text(n: tree_sitter::Node, code: &str) -> String {
-    n.utf8_text(code.as_bytes()).unwrap_or("").to_string()
+#[inline]
+fn get_text(n: tree_sitter::Node, code: &[u8]) -> String {
+    n.utf8_text(code).unwrap_or("").to_string()
 }
 
 /// Local imports are typically relative paths starting with '.'
+#[inline]
 fn is_local_import(import_path: &str) -> bool {
     import_path.starts_with('.')
 }
 
 /// Extracts the import path string from an import or export statement
-fn extract_import_path(node: tree_sitter::Node, code: &str) -> Option<String> {
+fn extract_import_path(node: tree_sitter::Node, code: &[u8]) -> Option<String> {
     node.child_by_field_name("source")
         .map(|source_node| get_text(source_node, code))
         .map(|path_text| path_text.trim_matches('"').trim_matches('\'').to_string())
 }
 
 pub fn parse_typescript_file<P: AsRef<Path>>(path: P) -> Option<FileNode> {
-    let code = fs::read_to_string(&path).ok()?;
-    let loc = code.matches('\n').count() as u32 + 1;
-
-    let mut parser = Parser::new();
-    parser
-        .set_language(&ts_typescript::LANGUAGE_TYPESCRIPT.into())
-        .expect("Error loading TypeScript grammar");
-    let tree = parser.parse(&code, None)?;
+    // Read raw bytes; tree-sitter parses byte slices and token text is decoded
+    // lazily, so there is no need to validate the whole file as UTF-8 up front
+    let code = fs::read(&path).ok()?;
+    let loc = code.iter().filter(|&&b| b == b'\n').count() as u32 + 1;
+
+    let tree = PARSER.with(|parser| parser.borrow_mut().parse(&code, None))?;
     let root_node = tree.root_node();
 
     let mut imports = HashSet::new();
@@ -95,8 +96,15 @@ pub fn parse_typescript_file<P: AsRef<Path>>(path: P) -> Option<FileNode> {
             _ => {}
         }
 
+        // Only named nodes can contain the kinds matched above; skipping the
+        // anonymous punctuation/keyword tokens roughly halves the nodes visited.
+        // Comments and string literals can't contain declarations either, so
+        // their subtrees are pruned outright
         let mut child_cursor = node.walk();
-        for child in node.children(&mut child_cursor) {
+        for child in node.named_children(&mut child_cursor) {
+            if matches!(child.kind(), "comment" | "string" | "template_string") {
+                continue;
+            }
             stack.push(child);
         }
     }